@@ -0,0 +1,13 @@
+from .traffic_log import Direction, TrafficRecord, TrafficRecorder, TrafficLogReader
+from .replay_driver import ReplayDriver, ReplayReport
+
+__all__ = [
+    "Direction",
+    "TrafficRecord",
+    "TrafficRecorder",
+    "TrafficLogReader",
+    "ReplayDriver",
+    "ReplayReport"
+]
+
+__version__ = "0.9.9"
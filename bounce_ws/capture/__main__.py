@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+
+from bounce_ws.capture import ReplayDriver
+
+
+def main() -> None:
+    """
+    Replays a traffic log against a running server and prints the report.
+
+    Usage:
+        python -m bounce_ws.capture traffic.log ws://localhost:8080/ws --speed 2
+        python -m bounce_ws.capture traffic.log ws://localhost:8080/ws --speed max
+    """
+    parser = argparse.ArgumentParser(description="Replay a bounce-ws traffic log against a server")
+    parser.add_argument("log", help="path of the traffic log")
+    parser.add_argument("url", help="WebSocket URL of the server, e.g. ws://localhost:8080/ws")
+    parser.add_argument("--speed", default="1", help="replay speed factor or 'max', defaults to 1")
+    parser.add_argument("--linger", type=float, default=1.0,
+                        help="seconds to keep connections open after their last record, defaults to 1")
+    args = parser.parse_args()
+
+    speed = None if args.speed == "max" else float(args.speed)
+    report = asyncio.run(ReplayDriver(args.url, args.log, speed, args.linger).run())
+    print(report.format())
+
+
+if __name__ == '__main__':
+    main()
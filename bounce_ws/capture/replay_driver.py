@@ -0,0 +1,280 @@
+import asyncio
+import datetime
+import json
+import time
+from typing import Any, Optional
+
+from loguru import logger
+from websockets.asyncio.client import ClientConnection, connect
+
+from bounce_ws.capture.traffic_log import Direction, TrafficLogReader, TrafficRecord
+from bounce_ws.handlers import RPC_EVENT, RPC_RESULT_EVENT, RPC_ERROR_EVENT
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    """
+    Computes a percentile of sorted samples.
+
+    Args:
+        samples (list[float]): The sorted samples.
+        percent (float): The percentile in the range [0, 100].
+
+    Returns:
+        float: The percentile value, 0 if there are no samples.
+    """
+    if not samples:
+        return 0.0
+
+    return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+
+class ReplayReport:
+    """
+    Latency and throughput of a replayed run.
+
+    Attributes:
+        connections (int): The number of replayed connections.
+        sent (int): The number of messages sent to the server.
+        received (int): The number of messages received from the server.
+        recorded_outbound (int): The number of messages the server sent in the recorded run.
+        errors (int): The number of connections that failed.
+        duration (float): The wall time of the run in seconds.
+        delivery_latencies (list[float]): Time from the server timestamp of a message to its receipt.
+        rpc_latencies (list[float]): Round trip time of RPC calls.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty report.
+        """
+        self.connections: int = 0
+        self.sent: int = 0
+        self.received: int = 0
+        self.recorded_outbound: int = 0
+        self.errors: int = 0
+        self.duration: float = 0.0
+        self.delivery_latencies: list[float] = []
+        self.rpc_latencies: list[float] = []
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarizes the run.
+
+        Returns:
+            dict[str, Any]: Counters, throughput (messages per second) and latency percentiles (in seconds).
+        """
+        delivery = sorted(self.delivery_latencies)
+        rpc = sorted(self.rpc_latencies)
+        duration = self.duration or 1.0
+
+        return {
+            "connections": self.connections,
+            "errors": self.errors,
+            "duration": self.duration,
+            "sent": self.sent,
+            "received": self.received,
+            "recorded_outbound": self.recorded_outbound,
+            "sent_per_second": self.sent / duration,
+            "received_per_second": self.received / duration,
+            "delivery_p50": _percentile(delivery, 50),
+            "delivery_p99": _percentile(delivery, 99),
+            "rpc_p50": _percentile(rpc, 50),
+            "rpc_p99": _percentile(rpc, 99)
+        }
+
+    def format(self) -> str:
+        """
+        Returns:
+            str: The summary as human-readable text.
+        """
+        summary = self.summary()
+
+        return (
+            f"connections: {summary['connections']} ({summary['errors']} failed), duration: {summary['duration']:.2f} s\n"
+            f"sent: {summary['sent']} ({summary['sent_per_second']:.1f}/s), "
+            f"received: {summary['received']} ({summary['received_per_second']:.1f}/s), "
+            f"recorded outbound: {summary['recorded_outbound']}\n"
+            f"delivery latency p50/p99: {summary['delivery_p50'] * 1000:.2f}/{summary['delivery_p99'] * 1000:.2f} ms\n"
+            f"rpc latency p50/p99: {summary['rpc_p50'] * 1000:.2f}/{summary['rpc_p99'] * 1000:.2f} ms"
+        )
+
+
+class ReplayDriver:
+    """
+    Drives a server with the client behaviour recorded in a traffic log.
+
+    Every recorded connection is opened as a real WebSocket client, and its inbound messages are sent
+    at the recorded times scaled by the speed factor. Message timestamps are replaced with the current
+    time, so the server does not discard them as outdated.
+
+    Attributes:
+        _url (str): The WebSocket URL of the server.
+        _log_path (str): The path of the traffic log.
+        _speed (Optional[float]): The replay speed factor, None for maximum speed.
+        _linger (float): The time to keep a connection open after its last record in seconds.
+        _report (ReplayReport): The report of the current run.
+        _origin (float): The recorded time of the first record.
+        _started (float): The wall time of the run start.
+    """
+
+    def __init__(self, url: str, log_path: str, speed: Optional[float] = 1.0, linger: float = 1.0):
+        """
+        Initializes the driver.
+
+        Args:
+            url (str): The WebSocket URL of the server, e.g. 'ws://localhost:8080/ws'.
+            log_path (str): The path of the traffic log.
+            speed (Optional[float], optional): The replay speed factor, None for maximum speed. Defaults to 1.0.
+            linger (float, optional): Seconds to keep a connection open after its last record. Defaults to 1.0.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("Speed must be greater than zero.")
+
+        self._url: str = url
+        self._log_path: str = log_path
+        self._speed: Optional[float] = speed
+        self._linger: float = linger
+
+        self._report: ReplayReport = ReplayReport()
+        self._origin: float = 0.0
+        self._started: float = 0.0
+
+    async def run(self) -> ReplayReport:
+        """
+        Replays the log against the server.
+
+        Returns:
+            ReplayReport: Latency and throughput of the run.
+        """
+        self._report = ReplayReport()
+        connections: dict[int, list[TrafficRecord]] = dict()
+
+        with TrafficLogReader(self._log_path) as reader:
+            for record in reader:
+                if record.direction == Direction.OUTBOUND:
+                    self._report.recorded_outbound += 1
+                    continue
+
+                connections.setdefault(record.connection_id, []).append(record)
+
+        if not connections:
+            return self._report
+
+        self._origin = min(records[0].timestamp for records in connections.values())
+        self._started = time.perf_counter()
+        self._report.connections = len(connections)
+
+        await asyncio.gather(*(self._replay_connection(records) for records in connections.values()))
+
+        self._report.duration = time.perf_counter() - self._started
+        return self._report
+
+    async def _wait(self, timestamp: float) -> None:
+        """
+        Sleeps until the scaled recorded time of a record.
+
+        Args:
+            timestamp (float): The recorded monotonic time.
+        """
+        if self._speed is None:
+            return
+
+        delay = (timestamp - self._origin) / self._speed - (time.perf_counter() - self._started)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _replay_connection(self, records: list[TrafficRecord]) -> None:
+        """
+        Replays the records of a single connection.
+
+        Args:
+            records (list[TrafficRecord]): The connection's records in order.
+        """
+        await self._wait(records[0].timestamp)
+
+        calls: dict[Any, float] = dict()
+
+        try:
+            async with connect(self._url, max_size=None) as websocket:
+                receiver = asyncio.create_task(self._receive(websocket, calls))
+
+                for record in records:
+                    await self._wait(record.timestamp)
+
+                    if record.direction == Direction.DISCONNECT:
+                        break
+
+                    if record.direction != Direction.INBOUND:
+                        continue
+
+                    await websocket.send(self._restamp(record.payload, calls))
+                    self._report.sent += 1
+
+                await asyncio.sleep(self._linger)
+                receiver.cancel()
+        except Exception as e:
+            logger.error(f"Replayed connection failed: {e}")
+            self._report.errors += 1
+
+    async def _receive(self, websocket: ClientConnection, calls: dict[Any, float]) -> None:
+        """
+        Receives server messages and records their latency.
+
+        Args:
+            websocket (ClientConnection): The client connection.
+            calls (dict[Any, float]): Send times of the RPC calls in flight mapped by correlation ID.
+        """
+        async for text in websocket:
+            received = time.perf_counter()
+            now = datetime.datetime.now()
+            self._report.received += 1
+
+            try:
+                message = json.loads(text)
+            except json.JSONDecodeError:
+                continue
+
+            event = message.get("event")
+
+            if event in (RPC_RESULT_EVENT, RPC_ERROR_EVENT):
+                sent = calls.pop(message.get("data", dict()).get("id"), None)
+
+                if sent is not None:
+                    self._report.rpc_latencies.append(received - sent)
+                continue
+
+            timestamp = message.get("timestamp")
+
+            if timestamp is not None:
+                delay = (now - datetime.datetime.fromisoformat(timestamp)).total_seconds()
+                self._report.delivery_latencies.append(max(0.0, delay))
+
+    @staticmethod
+    def _restamp(payload: str, calls: dict[Any, float]) -> str:
+        """
+        Replaces the timestamp of a recorded message with the current time and registers RPC calls.
+
+        Args:
+            payload (str): The recorded message.
+            calls (dict[Any, float]): Send times of the RPC calls in flight mapped by correlation ID.
+
+        Returns:
+            str: The message to be sent.
+        """
+        try:
+            message = json.loads(payload)
+        except json.JSONDecodeError:
+            return payload
+
+        # A frame may contain a single message or a batch of messages
+        for envelope in message if isinstance(message, list) else [message]:
+            if not isinstance(envelope, dict):
+                continue
+
+            envelope["timestamp"] = datetime.datetime.now().isoformat()
+
+            if envelope.get("event") == RPC_EVENT and isinstance(envelope.get("data"), dict):
+                calls[envelope["data"].get("id")] = time.perf_counter()
+
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,256 @@
+import atexit
+import mmap
+import os
+import struct
+import time
+from enum import IntEnum
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+from loguru import logger
+
+
+LOG_MAGIC = b"BWSCAP01"
+
+# direction (u8), connection id (u32), monotonic timestamp (f64), payload length (u32)
+RECORD_HEADER = struct.Struct("<BIdI")
+
+
+class Direction(IntEnum):
+    """
+    Kinds of records stored in a traffic log.
+
+    Attributes:
+        CONNECT: A client connected, the payload is empty.
+        DISCONNECT: A client disconnected, the payload is empty.
+        INBOUND: A message received from a client.
+        OUTBOUND: A message queued to a client.
+    """
+    CONNECT = 0
+    DISCONNECT = 1
+    INBOUND = 2
+    OUTBOUND = 3
+
+
+class TrafficRecord(NamedTuple):
+    """
+    A single record of a traffic log.
+
+    Attributes:
+        direction (Direction): The kind of the record.
+        connection_id (int): The identifier of the connection.
+        timestamp (float): The monotonic time of the record in seconds.
+        payload (str): The message text, empty for connection records.
+    """
+    direction: Direction
+    connection_id: int
+    timestamp: float
+    payload: str
+
+
+class TrafficRecorder:
+    """
+    Appends inbound and outbound WebSocket messages to a compact binary log.
+
+    The log starts with `LOG_MAGIC` followed by records, each consisting of `RECORD_HEADER`
+    and the UTF-8 encoded payload. A log holds a single run of a server, since connection IDs and
+    monotonic timestamps are only meaningful within one process. Writes are buffered, so recording costs a struct pack
+    and a buffer append per message. When disabled, recording calls return immediately.
+
+    The buffer is flushed by the first record written after `flush_interval` seconds since the previous flush,
+    so a log of a process that is killed misses at most the last interval. The log is closed at interpreter exit.
+
+    Attributes:
+        _path (str): The path of the log file.
+        _file (BinaryIO): The log file opened for writing.
+        _enabled (bool): A flag indicating whether messages are recorded.
+        _flush_interval (Optional[float]): The maximum time records stay buffered in seconds, None to flush only on close.
+        _flush_deadline (float): The monotonic time after which the next record flushes the buffer.
+    """
+
+    def __init__(self, path: str, enabled: bool = True, buffer_size: int = 1 << 16,
+                 flush_interval: Optional[float] = 1.0):
+        """
+        Creates the log, an existing file at the path is overwritten.
+
+        Args:
+            path (str): The path of the log file.
+            enabled (bool, optional): Whether recording starts enabled. Defaults to True.
+            buffer_size (int, optional): The write buffer size in bytes. Defaults to 64 KiB.
+            flush_interval (Optional[float], optional): The maximum time records stay buffered in seconds,
+                                                        None to flush only on close. Defaults to 1 second.
+        """
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("Flush interval must be greater than zero.")
+
+        self._path: str = path
+        self._file: BinaryIO = open(path, "wb", buffering=buffer_size)
+        self._enabled: bool = enabled
+        self._flush_interval: Optional[float] = flush_interval
+        self._flush_deadline: float = float("inf") if flush_interval is None else time.monotonic() + flush_interval
+
+        self._file.write(LOG_MAGIC)
+        atexit.register(self.close)
+
+    @property
+    def path(self) -> str:
+        """
+        Returns:
+            str: The path of the log file.
+        """
+        return self._path
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: Whether messages are currently recorded.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        """
+        Toggles recording at runtime.
+
+        Args:
+            value (bool): True to record messages, False to skip them.
+        """
+        self._enabled = value
+
+    def record(self, direction: Direction, connection_id: int, payload: str = "") -> None:
+        """
+        Appends a record to the log.
+
+        Args:
+            direction (Direction): The kind of the record.
+            connection_id (int): The identifier of the connection.
+            payload (str, optional): The message text. Defaults to an empty string.
+        """
+        if not self._enabled or self._file.closed:
+            return
+
+        encoded = payload.encode("utf-8")
+        timestamp = time.monotonic()
+        self._file.write(RECORD_HEADER.pack(direction, connection_id, timestamp, len(encoded)))
+        self._file.write(encoded)
+
+        if timestamp >= self._flush_deadline:
+            self._file.flush()
+            self._flush_deadline = timestamp + self._flush_interval
+
+    def record_inbound(self, connection_id: int, payload: str) -> None:
+        """
+        Appends a message received from a client.
+
+        Args:
+            connection_id (int): The identifier of the connection.
+            payload (str): The message text.
+        """
+        self.record(Direction.INBOUND, connection_id, payload)
+
+    def record_outbound(self, connection_id: int, payload: str) -> None:
+        """
+        Appends a message queued to a client.
+
+        Args:
+            connection_id (int): The identifier of the connection.
+            payload (str): The message text.
+        """
+        self.record(Direction.OUTBOUND, connection_id, payload)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to the file.
+        """
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and closes the log file.
+        """
+        if not self._file.closed:
+            self._file.close()
+            atexit.unregister(self.close)
+
+
+class TrafficLogReader:
+    """
+    Reads a traffic log through a memory-mapped file.
+
+    Attributes:
+        _path (str): The path of the log file.
+        _file (Optional[BinaryIO]): The opened log file.
+        _mmap (Optional[mmap.mmap]): The memory map of the log file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the reader, the file is mapped on entering the context.
+
+        Args:
+            path (str): The path of the log file.
+        """
+        self._path: str = path
+        self._file: Optional[BinaryIO] = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __enter__(self) -> "TrafficLogReader":
+        """
+        Maps the log file into memory.
+
+        Raises:
+            ValueError: If the file is not a traffic log.
+        """
+        self._file = open(self._path, "rb")
+
+        if os.fstat(self._file.fileno()).st_size < len(LOG_MAGIC):
+            self._file.close()
+            raise ValueError(f"{self._path} is not a traffic log")
+
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(LOG_MAGIC)] != LOG_MAGIC:
+            self.__exit__()
+            raise ValueError(f"{self._path} is not a traffic log")
+
+        return self
+
+    def __exit__(self, *_) -> None:
+        """
+        Unmaps and closes the log file.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __iter__(self) -> Iterator[TrafficRecord]:
+        """
+        Iterates the records in the order they were written.
+
+        Logs:
+            - Warning if the log ends with a truncated record.
+        """
+        if self._mmap is None:
+            raise RuntimeError("TrafficLogReader must be used as a context manager")
+
+        data = self._mmap
+        offset = len(LOG_MAGIC)
+        end = len(data)
+
+        while offset + RECORD_HEADER.size <= end:
+            direction, connection_id, timestamp, length = RECORD_HEADER.unpack_from(data, offset)
+            offset += RECORD_HEADER.size
+
+            if offset + length > end:
+                logger.warning(f"Traffic log {self._path} ends with a truncated record")
+                return
+
+            payload = data[offset:offset + length].decode("utf-8")
+            offset += length
+
+            yield TrafficRecord(Direction(direction), connection_id, timestamp, payload)
@@ -0,0 +1,9 @@
+from .bounce_client import BounceClient, EventStream, RpcError
+
+__all__ = [
+    "BounceClient",
+    "EventStream",
+    "RpcError"
+]
+
+__version__ = "0.9.9"
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import time
+
+from bounce_ws.client import BounceClient
+
+
+async def _run_connection(args: argparse.Namespace, counters: dict[str, int], deadline: float) -> None:
+    """
+    Sends and receives messages over a single connection until the deadline.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        counters (dict[str, int]): The shared 'sent', 'received' and 'errors' counters.
+        deadline (float): The perf_counter time to stop at.
+    """
+    client = BounceClient(args.url, codec=args.codec, batch_interval=args.batch_interval,
+                          max_batch_size=args.batch_size, reconnect=False)
+
+    try:
+        await client.connect()
+    except Exception:
+        counters["errors"] += 1
+        return
+
+    stream = client.events()
+
+    async def receive() -> None:
+        async for _ in stream:
+            counters["received"] += 1
+
+    receiver = asyncio.create_task(receive())
+
+    if args.subscribe:
+        client.subscribe(args.subscribe)
+
+    delay = 1 / args.rate if args.rate > 0 else 0.0
+
+    while time.perf_counter() < deadline:
+        if not client.connected:
+            counters["errors"] += 1
+            break
+
+        if args.event:
+            if delay:
+                client.send(args.event, {})
+                counters["sent"] += 1
+                await asyncio.sleep(delay)
+                continue
+
+            for _ in range(args.batch_size):
+                client.send(args.event, {})
+
+            try:
+                await client.drain()
+            except ConnectionError:
+                # Messages queued when the connection was lost are not counted as sent
+                counters["errors"] += 1
+                break
+
+            counters["sent"] += args.batch_size
+        else:
+            await asyncio.sleep(deadline - time.perf_counter())
+
+    await client.close()
+    await receiver
+
+
+async def _run(args: argparse.Namespace) -> tuple[dict[str, int], float]:
+    """
+    Runs all connections concurrently.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        tuple[dict[str, int], float]: The counters at the deadline and the wall time until then in seconds.
+    """
+    counters = {"sent": 0, "received": 0, "errors": 0}
+    started = time.perf_counter()
+
+    connections = asyncio.gather(*(_run_connection(args, counters, started + args.duration)
+                                   for _ in range(args.connections)))
+
+    # Counters are taken at the deadline, closing a flooded connection may take a while
+    await asyncio.wait([connections], timeout=args.duration)
+    result = dict(counters), time.perf_counter() - started
+
+    await connections
+    return result
+
+
+def main() -> None:
+    """
+    Generates load against a running server and prints the throughput.
+
+    Usage:
+        python -m bounce_ws.client ws://localhost:8080/ws --connections 100 --subscribe clock
+        python -m bounce_ws.client ws://localhost:8080/ws --event ping --rate 0 --duration 10
+    """
+    parser = argparse.ArgumentParser(description="Generate load against a bounce-ws server")
+    parser.add_argument("url", help="WebSocket URL of the server, e.g. ws://localhost:8080/ws")
+    parser.add_argument("--connections", type=int, default=1, help="number of connections, defaults to 1")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run, defaults to 10")
+    parser.add_argument("--subscribe", nargs="*", default=[], help="events to subscribe to")
+    parser.add_argument("--event", help="event to send, nothing is sent if omitted")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="messages per second per connection, 0 for maximum rate, defaults to 0")
+    parser.add_argument("--batch-interval", type=float, default=0.0,
+                        help="seconds to collect outbound messages into a batch, defaults to 0")
+    parser.add_argument("--batch-size", type=int, default=256, help="maximum messages per frame, defaults to 256")
+    parser.add_argument("--codec", default="json", help="message codec, 'json' or 'orjson', defaults to 'json'")
+    args = parser.parse_args()
+
+    counters, duration = asyncio.run(_run(args))
+
+    print(f"connections: {args.connections} ({counters['errors']} failed), duration: {duration:.2f} s\n"
+          f"sent: {counters['sent']} ({counters['sent'] / duration:.1f}/s), "
+          f"received: {counters['received']} ({counters['received'] / duration:.1f}/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,654 @@
+import asyncio
+import datetime
+import itertools
+from collections import deque
+from typing import Any, Iterator, Optional, Union
+
+from loguru import logger
+from websockets.asyncio.client import ClientConnection, connect
+
+from bounce_ws.codecs import AbstractCodec, get_codec
+from bounce_ws.handlers import RPC_EVENT, RPC_CANCEL_EVENT, RPC_RESULT_EVENT, RPC_ERROR_EVENT
+from bounce_ws.senders import RESYNC_REQUIRED_EVENT
+
+
+class RpcError(Exception):
+    """
+    Raised by `BounceClient.call` when the server reports an RPC error or the connection is lost.
+    """
+
+
+class EventStream:
+    """
+    An async iterator over the received messages of an event.
+
+    The stream receives messages from the moment it is created, so messages arriving between
+    subscribing and starting the iteration are not lost. Iteration ends when the client is closed.
+    A stream that is no longer needed should be closed, otherwise it keeps buffering messages
+    until it is garbage collected.
+
+    Attributes:
+        _consumers (dict[str, list[asyncio.Queue]]): The consumer queues of the client the stream is registered to.
+        _event (str): The event name, '*' for all events.
+        _queue (asyncio.Queue): The bounded queue of received messages, the oldest are dropped when full.
+        _closed (bool): A flag indicating whether the stream is unregistered.
+    """
+
+    def __init__(self, consumers: dict[str, list[asyncio.Queue]], event: str, queue_size: int):
+        """
+        Registers the stream to the client's consumers.
+
+        Args:
+            consumers (dict[str, list[asyncio.Queue]]): The consumer queues of the client mapped by event names.
+            event (str): The event name, '*' for all events.
+            queue_size (int): The capacity of the queue.
+        """
+        self._consumers: dict[str, list[asyncio.Queue]] = consumers
+        self._event: str = event
+        self._queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self._closed: bool = False
+
+        consumers.setdefault(event, []).append(self._queue)
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        """
+        Waits for the next received message.
+
+        Returns:
+            dict[str, Any]: The received message with 'event', 'data' and 'timestamp' keys.
+
+        Raises:
+            StopAsyncIteration: If the stream or the client is closed.
+        """
+        if self._closed:
+            raise StopAsyncIteration
+
+        message = await self._queue.get()
+
+        if message is None:
+            self.close()
+            raise StopAsyncIteration
+
+        return message
+
+    def close(self) -> None:
+        """
+        Unregisters the stream, it stops receiving messages.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        queues = self._consumers.get(self._event)
+
+        if queues is not None and self._queue in queues:
+            queues.remove(self._queue)
+
+            if not queues:
+                del self._consumers[self._event]
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class BounceClient:
+    """
+    An asyncio client for bounce-ws servers.
+
+    The client keeps a connection open in the background, reconnecting with exponential backoff.
+    After every reconnect it re-subscribes to the subscribed events, resuming senders with replay buffers
+    from the last received positions (epoch and sequence number). Outbound messages are queued without
+    waiting and written by a single writer, which packs all queued messages into one batch frame.
+    The outbound queue is capped, messages sent while it is full are dropped.
+    Received messages are consumed per event through `EventStream` async iterators.
+
+    Attributes:
+        _url (str): The WebSocket URL of the server.
+        _codec (AbstractCodec): The codec of the messages, should match the server's.
+        _batch_interval (float): The time (in seconds) the writer waits to collect a batch, 0 to send immediately.
+        _max_batch_size (int): The maximum number of messages in a single frame.
+        _reconnect (bool): A flag indicating whether the connection is restored after it is lost.
+        _backoff_initial (float): The first reconnect delay in seconds.
+        _backoff_max (float): The maximum reconnect delay in seconds.
+        _queue_size (int): The capacity of every consumer queue, the oldest messages are dropped when full.
+        _max_backlog (int): The maximum number of messages waiting to be written.
+        _dropped (int): The number of messages dropped because the outbound queue was full.
+        _subscriptions (dict[str, Optional[float]]): Subscribed events mapped to their requested rates.
+        _positions (dict[str, dict[str, Any]]): The epochs and sequence numbers of the last received messages
+                                                mapped by event names.
+        _outbound (deque[dict[str, Any]]): Messages waiting to be written.
+        _consumers (dict[str, list[asyncio.Queue]]): Consumer queues mapped by event names, '*' for all events.
+        _calls (dict[int, asyncio.Future]): RPC calls in flight mapped by correlation ID.
+        _call_ids (Iterator[int]): The correlation ID generator.
+        _websocket (Optional[ClientConnection]): The current connection, if connected.
+        _runner (Optional[asyncio.Task]): The task maintaining the connection.
+        _closing (bool): A flag indicating whether the client is being closed.
+        _pending (Optional[asyncio.Event]): Set when there are messages waiting to be written.
+        _drained (Optional[asyncio.Event]): Set when all queued messages are written or the client is disconnected.
+        _connected (Optional[asyncio.Event]): Set while the client is connected.
+    """
+
+    def __init__(self, url: str, codec: Union[str, AbstractCodec] = "json", batch_interval: float = 0.0,
+                 max_batch_size: int = 256, reconnect: bool = True, backoff_initial: float = 0.5,
+                 backoff_max: float = 30.0, queue_size: int = 1024, max_backlog: int = 65536):
+        """
+        Initializes the client, the connection is opened by `connect`.
+
+        Args:
+            url (str): The WebSocket URL of the server, e.g. 'ws://localhost:8080/ws'.
+            codec (Union[str, AbstractCodec], optional): The codec or its name, should match the server's.
+                                                         Defaults to 'json'.
+            batch_interval (float, optional): Seconds to collect outbound messages into a batch. Defaults to 0.
+            max_batch_size (int, optional): The maximum number of messages in a single frame. Defaults to 256.
+            reconnect (bool, optional): Whether to restore a lost connection. Defaults to True.
+            backoff_initial (float, optional): The first reconnect delay in seconds. Defaults to 0.5.
+            backoff_max (float, optional): The maximum reconnect delay in seconds. Defaults to 30.
+            queue_size (int, optional): The capacity of every consumer queue. Defaults to 1024.
+            max_backlog (int, optional): The maximum number of messages waiting to be written. Defaults to 65536.
+        """
+        if max_batch_size <= 0:
+            raise ValueError("Maximum batch size must be greater than zero.")
+
+        if max_backlog <= 0:
+            raise ValueError("Maximum backlog must be greater than zero.")
+
+        self._url: str = url
+        self._codec: AbstractCodec = get_codec(codec) if isinstance(codec, str) else codec
+        self._batch_interval: float = batch_interval
+        self._max_batch_size: int = max_batch_size
+        self._reconnect: bool = reconnect
+        self._backoff_initial: float = backoff_initial
+        self._backoff_max: float = backoff_max
+        self._queue_size: int = queue_size
+        self._max_backlog: int = max_backlog
+        self._dropped: int = 0
+
+        self._subscriptions: dict[str, Optional[float]] = dict()
+        self._positions: dict[str, dict[str, Any]] = dict()
+        self._outbound: deque[dict[str, Any]] = deque()
+        self._consumers: dict[str, list[asyncio.Queue]] = dict()
+        self._calls: dict[int, asyncio.Future] = dict()
+        self._call_ids: Iterator[int] = itertools.count(1)
+
+        self._websocket: Optional[ClientConnection] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._closing: bool = False
+        self._pending: Optional[asyncio.Event] = None
+        self._drained: Optional[asyncio.Event] = None
+        self._connected: Optional[asyncio.Event] = None
+
+    @property
+    def connected(self) -> bool:
+        """
+        Returns:
+            bool: Whether the client is currently connected.
+        """
+        return self._connected is not None and self._connected.is_set()
+
+    @property
+    def backlog(self) -> int:
+        """
+        Returns:
+            int: The number of messages waiting to be written.
+        """
+        return len(self._outbound)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Returns:
+            int: The number of messages dropped because the outbound queue was full.
+        """
+        return self._dropped
+
+    async def connect(self) -> None:
+        """
+        Starts maintaining the connection and waits until it is established.
+        """
+        if self._runner is not None:
+            return
+
+        self._closing = False
+        self._pending = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._connected = asyncio.Event()
+        self._runner = asyncio.create_task(self._run())
+
+        connected = asyncio.create_task(self._connected.wait())
+        await asyncio.wait([connected, self._runner], return_when=asyncio.FIRST_COMPLETED)
+
+        if not connected.done():
+            connected.cancel()
+            self._runner.result()
+            raise ConnectionError(f"Failed to connect to {self._url}")
+
+    async def close(self) -> None:
+        """
+        Closes the connection, fails the calls in flight and ends all consumer iterators.
+        """
+        self._closing = True
+
+        # Closing the connection with a handshake ends the runner, cancelling only interrupts a reconnect delay
+        if self._websocket is not None:
+            await self._websocket.close()
+
+        if self._runner is not None:
+            self._runner.cancel()
+
+            try:
+                await self._runner
+            except (asyncio.CancelledError, Exception):
+                pass
+
+            self._runner = None
+
+        if self._drained is not None:
+            self._drained.set()
+
+        self._fail_calls("Client closed")
+
+        for queues in self._consumers.values():
+            for queue in queues:
+                self._offer(queue, None)
+
+    async def __aenter__(self) -> "BounceClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    def send(self, event: str, data: Optional[dict[str, Any]] = None) -> None:
+        """
+        Queues a message for sending without waiting for the transmission.
+
+        If `max_backlog` messages are already waiting, the message is dropped.
+
+        Args:
+            event (str): The event name.
+            data (Optional[dict[str, Any]], optional): The message payload. Defaults to an empty dictionary.
+
+        Logs:
+            - Warning when messages start being dropped and then once per `max_backlog` dropped messages.
+        """
+        if len(self._outbound) >= self._max_backlog:
+            self._dropped += 1
+
+            if self._dropped % self._max_backlog == 1 or self._max_backlog == 1:
+                logger.warning(f"Outbound queue to {self._url} is full, {self._dropped} messages dropped so far")
+            return
+
+        self._enqueue(self._message(event, data))
+
+    async def drain(self) -> None:
+        """
+        Waits until the client is connected and all queued messages are written,
+        useful as backpressure for fast producers.
+
+        While the client is disconnected, waits for the reconnect.
+
+        Raises:
+            ConnectionError: If the client is closed or the connection is lost and not restored.
+        """
+        while True:
+            runner = self._runner
+
+            if runner is None or runner.done() or self._closing:
+                raise ConnectionError(f"Not connected to {self._url}")
+
+            connected = self.connected
+
+            if connected and self._drained.is_set():
+                return
+
+            # The drained event is also set on disconnect, so the condition is checked again after waking
+            waiter = asyncio.create_task(self._drained.wait() if connected else self._connected.wait())
+
+            try:
+                await asyncio.wait([waiter, runner], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+
+    def subscribe(self, events: list[str], rates: Optional[dict[str, float]] = None) -> None:
+        """
+        Subscribes to the events, the subscription is restored after every reconnect.
+
+        Args:
+            events (list[str]): The event names, '*' for all events.
+            rates (Optional[dict[str, float]], optional): Requested messages per second mapped by event names.
+                                                          Defaults to None.
+        """
+        rates = rates or dict()
+
+        for event in events:
+            self._subscriptions[event] = rates.get(event)
+
+        if self.connected:
+            self._enqueue(self._subscribe_message(events), first=True)
+
+    def unsubscribe(self, events: list[str]) -> None:
+        """
+        Unsubscribes from the events.
+
+        Args:
+            events (list[str]): The event names, '*' for all events.
+        """
+        if "*" in events:
+            self._subscriptions.clear()
+        else:
+            for event in events:
+                self._subscriptions.pop(event, None)
+
+        self._enqueue(self._message("unsubscribe", {"events": events}))
+
+    def events(self, event: str = "*") -> EventStream:
+        """
+        Creates a stream of the received messages of an event, iterated until the client is closed.
+
+        The stream buffers messages from this call on, so it should be created before subscribing.
+
+        Args:
+            event (str, optional): The event name, '*' for all events. Defaults to '*'.
+
+        Returns:
+            EventStream: The async iterator over the received messages.
+        """
+        return EventStream(self._consumers, event, self._queue_size)
+
+    async def call(self, method: str, params: Optional[dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+        """
+        Calls an RPC method and waits for its result.
+
+        If the call times out or the awaiting task is cancelled, the call is cancelled on the server,
+        or withdrawn if it wasn't written yet. If the connection is lost, the call fails and its queued
+        messages are discarded, so it is never sent after the failure was reported. A call written before
+        the connection was lost may still have been executed by the server.
+
+        Args:
+            method (str): The method name.
+            params (Optional[dict[str, Any]], optional): The call parameters. Defaults to None.
+            timeout (Optional[float], optional): The maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            Any: The result of the call.
+
+        Raises:
+            RpcError: If the server reports an error, the outbound queue is full or the connection is lost.
+            asyncio.TimeoutError: If the result is not received in time.
+        """
+        if len(self._outbound) >= self._max_backlog:
+            raise RpcError("Outbound queue is full")
+
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._calls[call_id] = future
+
+        request = self._message(RPC_EVENT, {"id": call_id, "method": method,
+                                            "params": params if params is not None else dict()})
+        self._enqueue(request)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            try:
+                self._outbound.remove(request)
+            except ValueError:
+                # The call was already written
+                self._enqueue(self._message(RPC_CANCEL_EVENT, {"id": call_id}))
+            raise
+        finally:
+            self._calls.pop(call_id, None)
+
+    async def _run(self) -> None:
+        """
+        Maintains the connection, reconnecting with exponential backoff.
+        """
+        backoff = self._backoff_initial
+
+        while not self._closing:
+            try:
+                async with connect(self._url, max_size=None) as websocket:
+                    self._websocket = websocket
+                    backoff = self._backoff_initial
+
+                    if self._subscriptions:
+                        self._outbound.appendleft(self._subscribe_message(list(self._subscriptions)))
+
+                    # Messages queued while disconnected are written now, `drain` waits for them
+                    if self._outbound:
+                        self._drained.clear()
+
+                    self._connected.set()
+                    self._pending.set()
+                    writer = asyncio.create_task(self._write(websocket))
+
+                    try:
+                        await self._read(websocket)
+                    finally:
+                        # The writer puts its unsent messages back before finishing
+                        writer.cancel()
+                        await asyncio.wait([writer])
+
+                        self._connected.clear()
+                        self._drained.set()
+                        self._websocket = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Connection to {self._url} lost: {e}")
+
+            self._fail_calls("Connection lost")
+
+            if not self._reconnect or self._closing:
+                return
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self._backoff_max)
+
+    async def _write(self, websocket: ClientConnection) -> None:
+        """
+        Writes queued messages, packing everything queued into batch frames.
+
+        Messages whose frame fails to be sent are put back to the front of the queue and written
+        again after a reconnect, so a message may be delivered twice but is never lost silently.
+
+        Args:
+            websocket (ClientConnection): The current connection.
+
+        Logs:
+            - Error if a batch can't be encoded, the batch is dropped.
+            - Warning if writing fails.
+        """
+        outbound = self._outbound
+        encode = self._codec.encode
+
+        try:
+            while True:
+                await self._pending.wait()
+                self._pending.clear()
+
+                if self._batch_interval > 0:
+                    await asyncio.sleep(self._batch_interval)
+
+                while outbound:
+                    batch = [outbound.popleft() for _ in range(min(len(outbound), self._max_batch_size))]
+
+                    try:
+                        frame = encode(batch[0] if len(batch) == 1 else batch)
+                    except (TypeError, ValueError) as e:
+                        logger.error(f"Failed to encode {len(batch)} messages, dropping them: {e}")
+                        continue
+
+                    try:
+                        await websocket.send(frame)
+                    except BaseException:
+                        outbound.extendleft(reversed(batch))
+                        raise
+
+                self._drained.set()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to write to {self._url}: {e}")
+
+    async def _read(self, websocket: ClientConnection) -> None:
+        """
+        Reads messages, resolving RPC calls and dispatching the rest to consumers.
+
+        Args:
+            websocket (ClientConnection): The current connection.
+        """
+        decode = self._codec.decode
+        consumers = self._consumers
+
+        async for frame in websocket:
+            try:
+                message = decode(frame)
+            except ValueError:
+                logger.error("Invalid message received")
+                continue
+
+            event = message.get("event")
+
+            if event == RPC_RESULT_EVENT or event == RPC_ERROR_EVENT:
+                self._resolve_call(event, message.get("data") or dict())
+                continue
+
+            sequence = message.get("seq")
+
+            if sequence is not None:
+                self._positions[event] = {"epoch": message.get("epoch"), "seq": sequence}
+            elif event == RESYNC_REQUIRED_EVENT:
+                self._positions.pop((message.get("data") or dict()).get("event"), None)
+
+            for queue in consumers.get(event, ()):
+                self._offer(queue, message)
+
+            for queue in consumers.get("*", ()):
+                self._offer(queue, message)
+
+    def _resolve_call(self, event: str, data: dict[str, Any]) -> None:
+        """
+        Completes an RPC call in flight with its result or error.
+
+        Args:
+            event (str): 'rpc_result' or 'rpc_error'.
+            data (dict[str, Any]): The contents of the response.
+        """
+        future = self._calls.get(data.get("id"))
+
+        if future is None or future.done():
+            return
+
+        if event == RPC_RESULT_EVENT:
+            future.set_result(data.get("result"))
+        else:
+            future.set_exception(RpcError(data.get("error")))
+
+    def _fail_calls(self, reason: str) -> None:
+        """
+        Fails all RPC calls in flight and discards their queued messages.
+
+        Args:
+            reason (str): The error description.
+        """
+        failed = set()
+
+        for call_id, future in self._calls.items():
+            if not future.done():
+                future.set_exception(RpcError(reason))
+                failed.add(call_id)
+
+        if not failed:
+            return
+
+        # Unsent calls would otherwise be executed after a reconnect although their callers were told they failed
+        outbound = self._outbound
+        kept = [message for message in outbound
+                if message["event"] not in (RPC_EVENT, RPC_CANCEL_EVENT) or message["data"].get("id") not in failed]
+
+        if len(kept) != len(outbound):
+            outbound.clear()
+            outbound.extend(kept)
+
+    def _enqueue(self, message: dict[str, Any], first: bool = False) -> None:
+        """
+        Queues a message regardless of the backlog limit and wakes the writer.
+
+        Args:
+            message (dict[str, Any]): The message.
+            first (bool, optional): Whether the message is written before the already queued ones. Defaults to False.
+        """
+        if first:
+            self._outbound.appendleft(message)
+        else:
+            self._outbound.append(message)
+
+        if self._pending is not None:
+            if self.connected:
+                self._drained.clear()
+
+            self._pending.set()
+
+    @staticmethod
+    def _message(event: str, data: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Creates an outbound message.
+
+        Args:
+            event (str): The event name.
+            data (Optional[dict[str, Any]]): The message payload, None for an empty dictionary.
+
+        Returns:
+            dict[str, Any]: The message.
+        """
+        return {
+            "event": event,
+            "data": data if data is not None else dict(),
+            "timestamp": datetime.datetime.now().isoformat()
+        }
+
+    def _subscribe_message(self, events: list[str]) -> dict[str, Any]:
+        """
+        Creates a subscribe message with the requested rates and the positions to resume from.
+
+        Args:
+            events (list[str]): The event names.
+
+        Returns:
+            dict[str, Any]: The subscribe message.
+        """
+        data: dict[str, Any] = {"events": events}
+
+        rates = {event: self._subscriptions[event] for event in events
+                 if self._subscriptions.get(event) is not None}
+        if rates:
+            data["rates"] = rates
+
+        # A wildcard subscription resumes every event a message was received for
+        if "*" in events:
+            resume_from = dict(self._positions)
+        else:
+            resume_from = {event: self._positions[event] for event in events if event in self._positions}
+        if resume_from:
+            data["resume_from"] = resume_from
+
+        return self._message("subscribe", data)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, message: Optional[dict[str, Any]]) -> None:
+        """
+        Puts a message into a consumer queue, dropping the oldest message if the queue is full.
+
+        Args:
+            queue (asyncio.Queue): The consumer queue.
+            message (Optional[dict[str, Any]]): The message, None to end the iterator.
+        """
+        if queue.full():
+            queue.get_nowait()
+
+        queue.put_nowait(message)
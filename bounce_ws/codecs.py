@@ -0,0 +1,123 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class AbstractCodec(ABC):
+    """
+    An abstract base class for message codecs.
+
+    A codec converts messages to WebSocket text frames and back. The server and its clients
+    should use codecs with the same wire format.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        Abstract property to define the codec name used in `get_codec`.
+
+        Returns:
+            str: The codec name.
+        """
+        raise NotImplementedError("Must specify 'name' in inherited Codec")
+
+    @abstractmethod
+    def encode(self, message: Any) -> str:
+        """
+        Encodes a message to a text frame.
+
+        Args:
+            message (Any): The message to be encoded.
+
+        Returns:
+            str: The encoded message.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def decode(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes a received frame.
+
+        Args:
+            data (Union[str, bytes]): The received frame.
+
+        Returns:
+            Any: The decoded message.
+
+        Raises:
+            ValueError: If the frame can't be decoded.
+        """
+        raise NotImplementedError()
+
+
+class JsonCodec(AbstractCodec):
+    """
+    JSON codec based on the standard library, producing the same text as `WebSocket.send_json`.
+    """
+
+    @property
+    def name(self) -> str:
+        return "json"
+
+    def encode(self, message: Any) -> str:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(AbstractCodec):
+    """
+    JSON codec based on the optional `orjson` package, wire compatible with `JsonCodec`.
+    """
+
+    def __init__(self):
+        """
+        Raises:
+            ImportError: If the `orjson` package is not installed.
+        """
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the 'orjson' package, install it with 'pip install orjson'")
+
+    @property
+    def name(self) -> str:
+        return "orjson"
+
+    def encode(self, message: Any) -> str:
+        return orjson.dumps(message).decode("utf-8")
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+def get_codec(name: str) -> AbstractCodec:
+    """
+    Creates a codec by its name.
+
+    Args:
+        name (str): The codec name, 'json' or 'orjson'.
+
+    Returns:
+        AbstractCodec: The codec instance.
+
+    Raises:
+        ValueError: If no codec with the name exists.
+        ImportError: If the codec's optional dependency is not installed.
+    """
+    if name == "json":
+        return JsonCodec()
+
+    if name == "orjson":
+        return OrjsonCodec()
+
+    raise ValueError(f"Unknown codec: {name}")
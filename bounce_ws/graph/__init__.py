@@ -0,0 +1,11 @@
+from .abstract_source import AbstractSource
+from .abstract_derived_sender import AbstractDerivedSender
+from .computation_graph import ComputationGraph
+
+__all__ = [
+    "AbstractSource",
+    "AbstractDerivedSender",
+    "ComputationGraph"
+]
+
+__version__ = "0.9.9"
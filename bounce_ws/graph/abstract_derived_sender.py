@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from typing import Any, Coroutine, Dict, Union
+
+from bounce_ws.graph.abstract_source import AbstractSource
+from bounce_ws.senders import AbstractTimedSender
+
+
+class AbstractDerivedSender(AbstractTimedSender, ABC):
+    """
+    An abstract timed sender deriving its messages from computation graph sources.
+
+    The sender is driven by a `ComputationGraph`, which evaluates the declared dependencies
+    once per tick and then sends the message, so the sender ticks at the graph's framerate.
+    Per-subscriber rates and adaptive mode work as for other timed senders.
+    Subclasses must implement `event_name` and `derive_message_data` instead of `create_message_data`.
+
+    Attributes:
+        _dependencies (list[AbstractSource]): The sources the messages are derived from.
+        _inputs (dict[str, Any]): The values of the dependencies of the latest tick mapped by source names.
+    """
+
+    def __init__(self, dependencies: list[AbstractSource], replay_buffer_size: int = 0, adaptive: bool = False,
+                 backlog_high: int = 32, backlog_low: int = 4, max_divisor: int = 64):
+        """
+        Initializes the sender with its dependencies.
+
+        Args:
+            dependencies (list[AbstractSource]): The sources the messages are derived from.
+            replay_buffer_size (int, optional): The number of last messages kept for resuming clients,
+                                                0 disables the replay buffer. Defaults to 0.
+            adaptive (bool, optional): Whether subscriber rates adapt to their outbound backlog. Defaults to False.
+            backlog_high (int, optional): The backlog above which a session rate is lowered. Defaults to 32.
+            backlog_low (int, optional): The backlog at which a session rate is raised back. Defaults to 4.
+            max_divisor (int, optional): The largest tick divisor in adaptive mode. Defaults to 64.
+        """
+        # The framerate is replaced by the framerate of the graph the sender is added to
+        super().__init__(1, replay_buffer_size, adaptive, backlog_high, backlog_low, max_divisor)
+
+        self._dependencies: list[AbstractSource] = list(dependencies)
+        self._inputs: dict[str, Any] = dict()
+
+    @property
+    def dependencies(self) -> list[AbstractSource]:
+        """
+        Returns:
+            list[AbstractSource]: The sources the messages are derived from.
+        """
+        return self._dependencies
+
+    def set_framerate(self, framerate: float) -> None:
+        """
+        Sets the framerate of the graph driving the sender, subscriber rates are relative to it.
+
+        Args:
+            framerate (float): The number of graph ticks per second.
+        """
+        if framerate <= 0:
+            raise ValueError("Framerate must be greater than zero.")
+
+        self._framerate = framerate
+        self._delay = 1 / framerate
+
+    async def start(self) -> None:
+        """
+        Derived senders are ticked by their `ComputationGraph`, so this method returns immediately.
+        """
+
+    def set_inputs(self, inputs: dict[str, Any]) -> None:
+        """
+        Sets the dependency values used by the next message.
+
+        Args:
+            inputs (dict[str, Any]): The values of the dependencies mapped by source names.
+        """
+        self._inputs = inputs
+
+    def create_message_data(self) -> Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]:
+        """
+        Generates the payload from the dependency values of the latest tick.
+
+        Returns:
+            Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]: The result of `derive_message_data`.
+        """
+        return self.derive_message_data(self._inputs)
+
+    @abstractmethod
+    def derive_message_data(self, inputs: dict[str, Any]) -> Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]:
+        """
+        Generates the payload for a WebSocket message from the dependency values.
+
+        It can be either synchronous (returning a dictionary) or asynchronous (returning a coroutine).
+
+        Args:
+            inputs (dict[str, Any]): The values of the dependencies mapped by source names.
+
+        Returns:
+            Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]:
+            - A dictionary representing the message payload if implemented synchronously.
+            - A coroutine resolving to a dictionary if implemented asynchronously.
+        """
+        raise NotImplementedError()
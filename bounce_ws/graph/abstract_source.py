@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Optional, Union
+
+
+class AbstractSource(ABC):
+    """
+    An abstract node of a computation graph producing a value once per tick.
+
+    Sources may depend on other sources, their values are passed to `compute` mapped by source names.
+    The value is memoized for the tick, so all senders and sources depending on it share one computation.
+
+    Attributes:
+        _dependencies (list[AbstractSource]): The sources whose values are required by `compute`.
+    """
+
+    def __init__(self, dependencies: Optional[list["AbstractSource"]] = None):
+        """
+        Initializes the source with its dependencies.
+
+        Args:
+            dependencies (Optional[list[AbstractSource]], optional): The sources this one is derived from.
+                                                                     Defaults to None.
+        """
+        self._dependencies: list[AbstractSource] = list(dependencies) if dependencies is not None else []
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        Abstract property to define the source name.
+
+        The name is the key of the source value in the inputs of dependent nodes.
+
+        Returns:
+            str: The source name.
+        """
+        raise NotImplementedError("Must specify 'name' in inherited Source")
+
+    @property
+    def dependencies(self) -> list["AbstractSource"]:
+        """
+        Returns:
+            list[AbstractSource]: The sources this one is derived from.
+        """
+        return self._dependencies
+
+    @abstractmethod
+    def compute(self, inputs: dict[str, Any]) -> Union[Any, Awaitable[Any]]:
+        """
+        Computes the source value for the current tick.
+
+        It can be either synchronous (returning the value) or asynchronous (returning a coroutine).
+
+        Args:
+            inputs (dict[str, Any]): The values of the dependencies mapped by source names.
+
+        Returns:
+            Union[Any, Awaitable[Any]]: The value, or a coroutine resolving to it.
+        """
+        raise NotImplementedError()
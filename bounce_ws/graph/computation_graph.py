@@ -0,0 +1,281 @@
+import asyncio
+import sys
+import traceback
+from typing import Any, Optional, TYPE_CHECKING
+
+from loguru import logger
+
+from bounce_ws.graph.abstract_source import AbstractSource
+from bounce_ws.graph.abstract_derived_sender import AbstractDerivedSender
+from bounce_ws.monitoring import SlowOperationProfiler
+
+if TYPE_CHECKING:
+    from bounce_ws.senders import SenderOrchestrator
+
+
+class ComputationGraph:
+    """
+    Evaluates shared sources once per tick and sends the messages of the senders derived from them.
+
+    Sources are grouped into levels by their dependency depth. Every tick the levels are evaluated in order,
+    with the sources of a level computed concurrently. Only the sources needed by senders that currently
+    have subscribers are evaluated, and each value is memoized for the tick. A failing source is logged
+    and only the sources and senders depending on it are skipped for the tick.
+
+    Attributes:
+        _delay (float): The delay interval (in seconds) between ticks.
+        _is_active (bool): A flag indicating whether the graph is currently active.
+        _senders (list[AbstractDerivedSender]): The senders driven by the graph.
+        _levels (list[list[AbstractSource]]): The sources grouped by dependency depth.
+        _source_names (dict[str, AbstractSource]): The sources mapped by names.
+        _tick (int): The number of evaluated ticks.
+        _profiler (Optional[SlowOperationProfiler]): Profiler timing source computations, if attached.
+        _orchestrator (Optional[SenderOrchestrator]): The orchestrator the graph is registered to, if any.
+    """
+
+    def __init__(self, framerate: float):
+        """
+        Initializes an empty graph ticking with a given frame rate.
+
+        Args:
+            framerate (float): The number of ticks per second.
+        """
+        if framerate <= 0:
+            raise ValueError("Framerate must be greater than zero.")
+
+        self._delay: float = 1 / framerate
+        self._is_active: bool = True
+
+        self._senders: list[AbstractDerivedSender] = []
+        self._levels: list[list[AbstractSource]] = []
+        self._source_names: dict[str, AbstractSource] = dict()
+        self._tick: int = 0
+        self._profiler: Optional[SlowOperationProfiler] = None
+        self._orchestrator: Optional["SenderOrchestrator"] = None
+
+    @property
+    def senders(self) -> list[AbstractDerivedSender]:
+        """
+        Returns:
+            list[AbstractDerivedSender]: The senders driven by the graph.
+        """
+        return list(self._senders)
+
+    @property
+    def sources(self) -> list[AbstractSource]:
+        """
+        Returns:
+            list[AbstractSource]: All sources of the graph in evaluation order.
+        """
+        return [source for level in self._levels for source in level]
+
+    @property
+    def tick(self) -> int:
+        """
+        Returns:
+            int: The number of evaluated ticks.
+        """
+        return self._tick
+
+    def add_sender(self, sender: AbstractDerivedSender) -> None:
+        """
+        Adds a sender together with all sources it depends on.
+
+        The sender ticks at the graph's framerate, and if the graph is already registered,
+        the sender is registered to the same orchestrator.
+
+        Args:
+            sender (AbstractDerivedSender): The sender to be driven by the graph.
+
+        Raises:
+            ValueError: If the dependencies contain a cycle or different sources share a name.
+        """
+        depths: dict[AbstractSource, int] = {source: depth
+                                             for depth, level in enumerate(self._levels) for source in level}
+
+        for source in sender.dependencies:
+            self._add_source(source, depths, set())
+
+        sender.set_framerate(1 / self._delay)
+        self._senders.append(sender)
+
+        if self._orchestrator is not None:
+            self._orchestrator.register_sender(sender)
+
+    def set_profiler(self, profiler: Optional[SlowOperationProfiler]) -> None:
+        """
+        Attaches a profiler that times source computations.
+
+        Args:
+            profiler (Optional[SlowOperationProfiler]): The profiler instance, or None to detach.
+        """
+        self._profiler = profiler
+
+    def set_orchestrator(self, orchestrator: Optional["SenderOrchestrator"]) -> None:
+        """
+        Sets the orchestrator registering the senders added to the graph later.
+
+        Args:
+            orchestrator (Optional[SenderOrchestrator]): The orchestrator the graph is registered to.
+        """
+        self._orchestrator = orchestrator
+
+    async def start(self) -> None:
+        """
+        Starts the periodic evaluation of the graph.
+
+        This method continuously evaluates ticks at the specified interval until `stop` is called.
+        A failing tick is logged and skipped.
+        """
+        self._is_active = True
+
+        while self._is_active:
+            try:
+                await self.evaluate()
+            except Exception as e:
+                logger.error(f"Error in computation graph tick: {e}")
+                traceback.print_exc(file=sys.stdout)
+
+            await asyncio.sleep(self._delay)
+
+    def stop(self) -> None:
+        """
+        Stops the periodic evaluation of the graph.
+        """
+        self._is_active = False
+
+    async def evaluate(self) -> None:
+        """
+        Evaluates a single tick and sends the messages of the senders with subscribers.
+        """
+        self._tick += 1
+
+        senders = [sender for sender in self._senders if sender.connection_count]
+
+        if not senders:
+            return
+
+        needed: set[AbstractSource] = set()
+        stack = [source for sender in senders for source in sender.dependencies]
+
+        while stack:
+            source = stack.pop()
+
+            if source not in needed:
+                needed.add(source)
+                stack.extend(source.dependencies)
+
+        values: dict[AbstractSource, Any] = dict()
+        failed: set[AbstractSource] = set()
+
+        for level in self._levels:
+            sources = []
+
+            for source in level:
+                if source not in needed:
+                    continue
+
+                if any(dependency in failed for dependency in source.dependencies):
+                    failed.add(source)
+                else:
+                    sources.append(source)
+
+            if not sources:
+                continue
+
+            results = await asyncio.gather(*(self._compute(source, values) for source in sources),
+                                           return_exceptions=True)
+
+            for source, result in zip(sources, results):
+                if isinstance(result, BaseException):
+                    failed.add(source)
+                    self._log_error(f"source {source.name}", result)
+                else:
+                    values[source] = result
+
+        senders = [sender for sender in senders if not any(source in failed for source in sender.dependencies)]
+
+        for sender in senders:
+            sender.set_inputs({source.name: values[source] for source in sender.dependencies})
+
+        results = await asyncio.gather(*(sender.send() for sender in senders), return_exceptions=True)
+
+        for sender, result in zip(senders, results):
+            if isinstance(result, BaseException):
+                self._log_error(f"sender {sender.event_name}", result)
+
+    async def _compute(self, source: AbstractSource, values: dict[AbstractSource, Any]) -> Any:
+        """
+        Computes a source value from the memoized values of its dependencies.
+
+        Args:
+            source (AbstractSource): The source to be computed.
+            values (dict[AbstractSource, Any]): The values computed during the current tick.
+
+        Returns:
+            Any: The source value.
+        """
+        inputs = {dependency.name: values[dependency] for dependency in source.dependencies}
+        profiler = self._profiler
+
+        if profiler is not None:
+            return await profiler.measure("source", source.name, source.compute, inputs)
+
+        value = source.compute(inputs)
+
+        if asyncio.iscoroutine(value):
+            value = await value
+
+        return value
+
+    @staticmethod
+    def _log_error(subject: str, error: BaseException) -> None:
+        """
+        Logs an error raised during a tick.
+
+        Args:
+            subject (str): The description of the failed source or sender.
+            error (BaseException): The raised error.
+        """
+        logger.error(f"Error in computation graph {subject}: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__, file=sys.stdout)
+
+    def _add_source(self, source: AbstractSource, depths: dict[AbstractSource, int],
+                    visiting: set[AbstractSource]) -> int:
+        """
+        Adds a source and its dependencies to the levels.
+
+        Args:
+            source (AbstractSource): The source to be added.
+            depths (dict[AbstractSource, int]): The depths of the already added sources.
+            visiting (set[AbstractSource]): The sources on the current dependency path.
+
+        Returns:
+            int: The depth of the source.
+
+        Raises:
+            ValueError: If the dependencies contain a cycle or different sources share a name.
+        """
+        if source in depths:
+            return depths[source]
+
+        if source in visiting:
+            raise ValueError(f"Source {source.name} depends on itself")
+
+        registered = self._source_names.get(source.name)
+        if registered is not None and registered is not source:
+            raise ValueError(f"Different sources share the name {source.name}")
+
+        visiting.add(source)
+        depth = max((self._add_source(dependency, depths, visiting) + 1 for dependency in source.dependencies),
+                    default=0)
+        visiting.discard(source)
+
+        while len(self._levels) <= depth:
+            self._levels.append([])
+
+        self._levels[depth].append(source)
+        self._source_names[source.name] = source
+        depths[source] = depth
+
+        return depth
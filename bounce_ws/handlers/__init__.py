@@ -1,8 +1,15 @@
 from .abstract_handler import AbstractHandler
+from .abstract_rpc_handler import (AbstractRpcHandler, RPC_EVENT, RPC_CANCEL_EVENT, RPC_RESULT_EVENT,
+                                   RPC_ERROR_EVENT)
 from .handler_orchestrator import HandlerOrchestrator
 
 __all__ = [
     "AbstractHandler",
+    "AbstractRpcHandler",
+    "RPC_EVENT",
+    "RPC_CANCEL_EVENT",
+    "RPC_RESULT_EVENT",
+    "RPC_ERROR_EVENT",
     "HandlerOrchestrator"
 ]
 
@@ -2,6 +2,7 @@ import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Awaitable
 
+from bounce_ws.monitoring import SlowOperationProfiler
 from bounce_ws.senders import AbstractSender
 
 
@@ -15,6 +16,7 @@ class AbstractHandler(ABC):
     Attributes:
         _callback_sender (AbstractSender): The sender instance used to send responses or
                                           follow-up messages after handling an event.
+        _profiler (Optional[SlowOperationProfiler]): Profiler timing data processing, if attached.
     """
     def __init__(self, callback_sender: Optional[AbstractSender] = None):
         """
@@ -25,6 +27,7 @@ class AbstractHandler(ABC):
                                               messages after handling the event. Can be None (default).
         """
         self._callback_sender: AbstractSender = callback_sender
+        self._profiler: Optional[SlowOperationProfiler] = None
 
     @property
     @abstractmethod
@@ -53,15 +56,29 @@ class AbstractHandler(ABC):
             data (dict): The event data received from the WebSocket connection.
         """
 
-        # 'process_data()' method may be asynchronous, so save the result and call 'await' later if needed
-        process =  self.process_data(data)
+        profiler = self._profiler
 
-        if asyncio.iscoroutine(process):
-            await process
+        if profiler is not None:
+            await profiler.measure("handler", self.event_name, self.process_data, data)
+        else:
+            # 'process_data()' method may be asynchronous, so save the result and call 'await' later if needed
+            process =  self.process_data(data)
+
+            if asyncio.iscoroutine(process):
+                await process
 
         if self._callback_sender is not None:
             await self._callback_sender.send()
 
+    def set_profiler(self, profiler: Optional[SlowOperationProfiler]) -> None:
+        """
+        Attaches a profiler that times `process_data`.
+
+        Args:
+            profiler (Optional[SlowOperationProfiler]): The profiler instance, or None to detach.
+        """
+        self._profiler = profiler
+
     @abstractmethod
     def process_data(self, data: dict[str, Any]) -> Optional[Awaitable[Any]]:
         """
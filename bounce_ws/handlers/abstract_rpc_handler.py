@@ -0,0 +1,109 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Awaitable, Union
+
+from bounce_ws.monitoring import SlowOperationProfiler
+
+
+RPC_EVENT = "rpc"
+RPC_CANCEL_EVENT = "rpc_cancel"
+RPC_RESULT_EVENT = "rpc_result"
+RPC_ERROR_EVENT = "rpc_error"
+
+
+class AbstractRpcHandler(ABC):
+    """
+    An abstract base class for request/response WebSocket calls.
+
+    Unlike `AbstractHandler`, which broadcasts through a callback sender to every subscriber,
+    the value returned by an RPC handler is sent only to the calling connection,
+    tagged with the correlation ID of the call.
+
+    Attributes:
+        _timeout (Optional[float]): The maximum duration of a call in seconds, None for no limit.
+        _profiler (Optional[SlowOperationProfiler]): Profiler timing call processing, if attached.
+    """
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Initializes the handler with a call timeout.
+
+        Args:
+            timeout (Optional[float], optional): The maximum duration of a call in seconds. Defaults to None.
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be greater than zero.")
+
+        self._timeout: Optional[float] = timeout
+        self._profiler: Optional[SlowOperationProfiler] = None
+
+    @property
+    @abstractmethod
+    def method_name(self) -> str:
+        """
+        Abstract property to define the method name that this handler serves.
+
+        Returns:
+            str: The method name clients specify in 'rpc' messages.
+
+        Raises:
+            NotImplementedError: If not implemented in a subclass.
+        """
+        raise NotImplementedError("Must specify 'method_name' in inherited RPC Handler")
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """
+        Returns:
+            Optional[float]: The maximum duration of a call in seconds, None for no limit.
+        """
+        return self._timeout
+
+    async def call(self, params: dict[str, Any]) -> Any:
+        """
+        Processes a call and returns its result.
+
+        Calls abstract 'process_call' that must be implemented in inherited class
+
+        Args:
+            params (dict): The call parameters received from the WebSocket connection.
+
+        Returns:
+            Any: The JSON-serializable result of the call.
+        """
+        profiler = self._profiler
+
+        if profiler is not None:
+            return await profiler.measure("rpc", self.method_name, self.process_call, params)
+
+        # 'process_call()' method may be asynchronous, so save the result and call 'await' later if needed
+        result = self.process_call(params)
+
+        if asyncio.iscoroutine(result):
+            result = await result
+
+        return result
+
+    def set_profiler(self, profiler: Optional[SlowOperationProfiler]) -> None:
+        """
+        Attaches a profiler that times `process_call`.
+
+        Args:
+            profiler (Optional[SlowOperationProfiler]): The profiler instance, or None to detach.
+        """
+        self._profiler = profiler
+
+    @abstractmethod
+    def process_call(self, params: dict[str, Any]) -> Union[Any, Awaitable[Any]]:
+        """
+        Abstract method to process a call and produce its result
+
+        Args:
+            params (dict): The call parameters received from the WebSocket connection.
+
+        Returns:
+            Union[Any, Awaitable[Any]]: The JSON-serializable result, or a coroutine resolving to it.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Must define 'process_call' behaviour in inherited RPC Handler")
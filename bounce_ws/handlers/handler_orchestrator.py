@@ -1,9 +1,13 @@
+import asyncio
 import datetime
 from typing import Optional, Any
 
 from loguru import logger
 
-from bounce_ws.handlers import AbstractHandler
+from bounce_ws.handlers import AbstractHandler, AbstractRpcHandler, RPC_RESULT_EVENT, RPC_ERROR_EVENT
+from bounce_ws.codecs import AbstractCodec, JsonCodec
+from bounce_ws.monitoring import SlowOperationProfiler
+from bounce_ws.sessions import Priority, Session
 
 
 class HandlerOrchestrator:
@@ -13,17 +17,35 @@ class HandlerOrchestrator:
     This class acts as a central registry for event handlers and ensures that messages
     are routed to the appropriate handlers based on the event name.
 
+    It also registers RPC handlers by method name and runs their calls concurrently,
+    tracking the calls in flight per connection so they can be cancelled.
+
     Attributes:
         _handlers_dict (dict[str, AbstractHandler]): A dictionary storing handlers mapped by event names.
         _last_event_timestamp (dict[str, datetime.datetime]): A dictionary storing timestamps of last event processing
+        _profiler (Optional[SlowOperationProfiler]): Profiler attached to every registered handler.
+        _rpc_handlers_dict (dict[str, AbstractRpcHandler]): A dictionary storing RPC handlers mapped by method names.
+        _calls (dict[Session, dict[Any, asyncio.Task]]): Calls in flight mapped by session and correlation ID.
+        _max_calls (int): The maximum number of calls in flight per connection.
+        _codec (AbstractCodec): The codec encoding RPC responses.
     """
 
-    def __init__(self):
+    def __init__(self, max_calls_per_connection: int = 64):
         """
         Initializes the orchestrator with an empty handler registry.
+
+        Args:
+            max_calls_per_connection (int, optional): The maximum number of RPC calls in flight
+                                                      per connection. Defaults to 64.
         """
         self._handlers_dict: dict[str, AbstractHandler] = dict()
         self._last_event_timestamp: dict[str, datetime.datetime] = dict()
+        self._profiler: Optional[SlowOperationProfiler] = None
+
+        self._rpc_handlers_dict: dict[str, AbstractRpcHandler] = dict()
+        self._calls: dict[Session, dict[Any, asyncio.Task]] = dict()
+        self._max_calls: int = max_calls_per_connection
+        self._codec: AbstractCodec = JsonCodec()
 
     @property
     def registered_events(self) -> list[str]:
@@ -76,6 +98,9 @@ class HandlerOrchestrator:
         self._handlers_dict[handler.event_name] = handler
         self._last_event_timestamp[handler.event_name] = datetime.datetime.now()
 
+        if self._profiler is not None:
+            handler.set_profiler(self._profiler)
+
     def unregister_handler(self, handler: AbstractHandler) -> None:
         """
         Unregisters a handler instance based on its event name.
@@ -127,7 +152,276 @@ class HandlerOrchestrator:
             logger.warning(f"Received event for {event_name} without corresponding handler registered")
             return
 
-        await handler.handle(data)
+        if self._profiler is None:
+            await handler.handle(data)
+            return
+
+        with self._profiler.span("dispatch", event_name):
+            await handler.handle(data)
+
+    def set_profiler(self, profiler: Optional[SlowOperationProfiler]) -> None:
+        """
+        Attaches a profiler to all registered handlers and to the ones registered later.
+
+        Args:
+            profiler (Optional[SlowOperationProfiler]): The profiler instance, or None to detach.
+        """
+        self._profiler = profiler
+
+        for handler in self._handlers_dict.values():
+            handler.set_profiler(profiler)
+
+        for rpc_handler in self._rpc_handlers_dict.values():
+            rpc_handler.set_profiler(profiler)
+
+    def set_codec(self, codec: AbstractCodec) -> None:
+        """
+        Sets the codec encoding RPC responses.
+
+        Args:
+            codec (AbstractCodec): The codec instance.
+        """
+        self._codec = codec
+
+    @property
+    def registered_methods(self) -> list[str]:
+        """
+        Retrieves a list of currently registered RPC method names.
+
+        Returns:
+            list[str]: A list of method names that have associated RPC handlers.
+        """
+        return list(self._rpc_handlers_dict.keys())
+
+    def register_rpc_handler(self, handler: AbstractRpcHandler) -> None:
+        """
+        Registers an RPC handler instance for a specific method.
+
+        If a handler for the method already exists, an error is logged and registration is ignored.
+
+        Args:
+            handler (AbstractRpcHandler): The RPC handler instance to be registered.
+
+        Logs:
+            - Error if the handler for the given method is already registered.
+        """
+        if handler.method_name in self._rpc_handlers_dict:
+            logger.error(f"RPC handler for method {handler.method_name} is already registered, ignoring...")
+            return
+
+        self._rpc_handlers_dict[handler.method_name] = handler
+
+        if self._profiler is not None:
+            handler.set_profiler(self._profiler)
+
+    def unregister_rpc_handler(self, handler: AbstractRpcHandler) -> None:
+        """
+        Unregisters an RPC handler instance based on its method name.
+
+        Args:
+            handler (AbstractRpcHandler): The RPC handler instance to be unregistered.
+
+        Logs:
+            - Error if no handler is found for the given method.
+            - Error if the provided handler does not match the registered handler.
+        """
+        if handler.method_name not in self._rpc_handlers_dict:
+            logger.error(f"No RPC handler found for method {handler.method_name}, can't unregister")
+            return
+
+        if self._rpc_handlers_dict[handler.method_name] != handler:
+            logger.error(f"RPC handler instance for method {handler.method_name} does not match, can't unregister")
+            return
+
+        del self._rpc_handlers_dict[handler.method_name]
+
+    def handle_call(self, session: Session, data: dict[str, Any]) -> None:
+        """
+        Starts an RPC call in the background, so the connection can issue further calls concurrently.
+
+        The 'rpc' message must contain 'id' (a string or an integer) and 'method' keys and may contain 'params'.
+        The result or the error is sent only to the calling session.
+
+        Args:
+            session (Session): The session of the calling connection.
+            data (dict): The contents of the 'rpc' message.
+        """
+        if not isinstance(data, dict):
+            logger.warning('Invalid contents of "rpc" event, ignoring...')
+            return
+
+        call_id = data.get("id")
+
+        if call_id is None:
+            logger.warning('No "id" specified in "rpc" event, ignoring...')
+            return
+
+        if not self._is_valid_id(call_id):
+            self._send_error(session, call_id, "Invalid call id, must be a string or an integer")
+            return
+
+        method = data.get("method")
+
+        if not isinstance(method, str):
+            self._send_error(session, call_id, "Invalid method, must be a string")
+            return
+
+        handler = self._rpc_handlers_dict.get(method)
+
+        if handler is None:
+            self._send_error(session, call_id, f"Unknown method: {method}")
+            return
+
+        calls = self._calls.setdefault(session, dict())
+
+        if call_id in calls:
+            self._send_error(session, call_id, "Call with the same id is already in flight")
+            return
+
+        if len(calls) >= self._max_calls:
+            self._send_error(session, call_id, "Too many calls in flight")
+            return
+
+        task = asyncio.create_task(self._run_call(session, call_id, handler, data.get("params") or dict()))
+        task.add_done_callback(lambda _: self._finish_call(session, call_id, task))
+        calls[call_id] = task
+
+    def cancel_call(self, session: Session, data: dict[str, Any]) -> None:
+        """
+        Cancels an RPC call in flight, the caller receives a 'cancelled' error.
+
+        Args:
+            session (Session): The session of the calling connection.
+            data (dict): The contents of the 'rpc_cancel' message, containing the 'id' key.
+        """
+        call_id = data.get("id") if isinstance(data, dict) else None
+
+        if not self._is_valid_id(call_id):
+            logger.warning('Invalid "id" specified in "rpc_cancel" event, ignoring...')
+            return
+
+        task = self._calls.get(session, dict()).get(call_id)
+
+        if task is not None:
+            task.cancel()
+
+    def cancel_calls(self, session: Session) -> None:
+        """
+        Cancels all RPC calls in flight of a connection, e.g. after it disconnected.
+
+        Args:
+            session (Session): The session of the connection.
+        """
+        calls = self._calls.pop(session, None)
+
+        if calls is None:
+            return
+
+        for task in calls.values():
+            task.cancel()
+
+    async def _run_call(self, session: Session, call_id: Any, handler: AbstractRpcHandler,
+                        params: dict[str, Any]) -> None:
+        """
+        Runs an RPC call with the handler's timeout and sends its outcome to the caller.
+
+        Args:
+            session (Session): The session of the calling connection.
+            call_id (Any): The correlation ID of the call.
+            handler (AbstractRpcHandler): The handler serving the call.
+            params (dict): The call parameters.
+        """
+        try:
+            if self._profiler is None:
+                result = await asyncio.wait_for(handler.call(params), handler.timeout)
+            else:
+                with self._profiler.span("dispatch", handler.method_name):
+                    result = await asyncio.wait_for(handler.call(params), handler.timeout)
+
+            # Encoding fails for results that aren't serializable, the caller receives an error then
+            response = self._encode_response(RPC_RESULT_EVENT, {"id": call_id, "result": result})
+        except asyncio.TimeoutError:
+            self._send_error(session, call_id, "Timeout")
+        except Exception as e:
+            logger.error(f"RPC call of {handler.method_name} failed: {e}")
+            self._send_error(session, call_id, str(e))
+        else:
+            session.send(response, Priority.HIGH)
+
+    def _finish_call(self, session: Session, call_id: Any, task: asyncio.Task) -> None:
+        """
+        Forgets a finished RPC call and reports its cancellation to the caller.
+
+        Args:
+            session (Session): The session of the calling connection.
+            call_id (Any): The correlation ID of the call.
+            task (asyncio.Task): The finished task of the call.
+        """
+        calls = self._calls.get(session)
+
+        if calls is not None and calls.get(call_id) is task:
+            del calls[call_id]
+
+            if not calls:
+                del self._calls[session]
+
+        if task.cancelled():
+            self._send_error(session, call_id, "Cancelled")
+
+    def _send_error(self, session: Session, call_id: Any, error: str) -> None:
+        """
+        Sends an RPC error to the caller.
+
+        Args:
+            session (Session): The session of the calling connection.
+            call_id (Any): The correlation ID of the call.
+            error (str): The error description.
+        """
+        self._send_response(session, RPC_ERROR_EVENT, {"id": call_id, "error": error})
+
+    def _send_response(self, session: Session, event_name: str, data: dict[str, Any]) -> None:
+        """
+        Queues an RPC response to the caller with high priority.
+
+        Args:
+            session (Session): The session of the calling connection.
+            event_name (str): The event name of the response.
+            data (dict): The contents of the response.
+        """
+        session.send(self._encode_response(event_name, data), Priority.HIGH)
+
+    def _encode_response(self, event_name: str, data: dict[str, Any]) -> str:
+        """
+        Encodes an RPC response.
+
+        Args:
+            event_name (str): The event name of the response.
+            data (dict): The contents of the response.
+
+        Returns:
+            str: The encoded response.
+
+        Raises:
+            Exception: If the contents can't be encoded by the codec.
+        """
+        return self._codec.encode({
+            "event": event_name,
+            "data": data,
+            "timestamp": datetime.datetime.now().isoformat()
+        })
+
+    @staticmethod
+    def _is_valid_id(call_id: Any) -> bool:
+        """
+        Checks if a correlation ID received from a client is usable.
+
+        Args:
+            call_id (Any): The correlation ID.
+
+        Returns:
+            bool: True for strings and integers.
+        """
+        return isinstance(call_id, (str, int)) and not isinstance(call_id, bool)
 
     def refresh(self) -> None:
         """
@@ -0,0 +1,10 @@
+from .loop_lag_monitor import LoopLagMonitor
+from .slow_operation_profiler import SlowOperationProfiler, OperationStats
+
+__all__ = [
+    "LoopLagMonitor",
+    "SlowOperationProfiler",
+    "OperationStats"
+]
+
+__version__ = "0.9.9"
@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+from loguru import logger
+
+
+class LoopLagMonitor:
+    """
+    Probes the event loop responsiveness by measuring how late a periodic wakeup occurs.
+
+    The monitor sleeps for a fixed interval and compares the actual wakeup time with the expected one.
+    The difference is the time the loop was blocked by other callbacks.
+
+    Attributes:
+        _interval (float): The probe interval (in seconds).
+        _threshold (float): The lag (in seconds) after which a warning is logged.
+        _enabled (bool): A flag indicating whether lag values are recorded.
+        _is_active (bool): A flag indicating whether the probe loop is running.
+        _last_lag (float): The lag measured by the latest probe.
+        _max_lag (float): The largest lag measured since the last reset.
+        _total_lag (float): The summed lag of all probes since the last reset.
+        _probes (int): The number of probes since the last reset.
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.05, enabled: bool = True):
+        """
+        Initializes the monitor.
+
+        Args:
+            interval (float, optional): The probe interval in seconds. Defaults to 0.1.
+            threshold (float, optional): The lag warning threshold in seconds. Defaults to 0.05.
+            enabled (bool, optional): Whether lag values are recorded from the start. Defaults to True.
+        """
+        if interval <= 0:
+            raise ValueError("Interval must be greater than zero.")
+
+        self._interval: float = interval
+        self._threshold: float = threshold
+        self._enabled: bool = enabled
+        self._is_active: bool = True
+
+        self._last_lag: float = 0.0
+        self._max_lag: float = 0.0
+        self._total_lag: float = 0.0
+        self._probes: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: Whether lag values are currently recorded.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        """
+        Toggles lag recording at runtime.
+
+        Args:
+            value (bool): True to record lag values, False to only keep the probe idle.
+        """
+        self._enabled = value
+
+    @property
+    def last_lag(self) -> float:
+        """
+        Returns:
+            float: The lag measured by the latest probe in seconds.
+        """
+        return self._last_lag
+
+    @property
+    def max_lag(self) -> float:
+        """
+        Returns:
+            float: The largest lag measured since the last reset in seconds.
+        """
+        return self._max_lag
+
+    @property
+    def average_lag(self) -> float:
+        """
+        Returns:
+            float: The average lag since the last reset in seconds.
+        """
+        return self._total_lag / self._probes if self._probes else 0.0
+
+    async def start(self) -> None:
+        """
+        Starts probing the event loop until `stop` is called.
+
+        Logs:
+            - Warning if the measured lag exceeds the threshold.
+        """
+        self._is_active = True
+
+        while self._is_active:
+            expected = time.perf_counter() + self._interval
+            await asyncio.sleep(self._interval)
+
+            if not self._enabled:
+                continue
+
+            lag = max(0.0, time.perf_counter() - expected)
+
+            self._last_lag = lag
+            self._total_lag += lag
+            self._probes += 1
+
+            if lag > self._max_lag:
+                self._max_lag = lag
+
+            if lag > self._threshold:
+                logger.warning(f"Event loop lag of {lag * 1000:.1f} ms detected")
+
+    def stop(self) -> None:
+        """
+        Stops the probe loop gracefully.
+        """
+        self._is_active = False
+
+    def reset(self) -> None:
+        """
+        Discards all accumulated lag values.
+        """
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+        self._probes = 0
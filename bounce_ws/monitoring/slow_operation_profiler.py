@@ -0,0 +1,315 @@
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Coroutine, Optional
+
+from loguru import logger
+
+
+class OperationStats:
+    """
+    Accumulated timing statistics of a single profiled operation.
+
+    Attributes:
+        kind (str): The kind of the operation ('handler', 'sender', ...).
+        event_name (str): The event name the operation is attributed to.
+        calls (int): The number of measured invocations.
+        slow_calls (int): The number of invocations that exceeded the threshold.
+        total_time (float): The summed duration of all invocations (in seconds).
+        max_time (float): The longest single invocation (in seconds).
+    """
+    __slots__ = ("kind", "event_name", "calls", "slow_calls", "total_time", "max_time")
+
+    def __init__(self, kind: str, event_name: str):
+        self.kind: str = kind
+        self.event_name: str = event_name
+        self.calls: int = 0
+        self.slow_calls: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+
+    @property
+    def average_time(self) -> float:
+        """
+        Returns:
+            float: The average duration of an invocation (in seconds).
+        """
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: The statistics as a JSON-serializable dictionary.
+        """
+        return {
+            "kind": self.kind,
+            "event": self.event_name,
+            "calls": self.calls,
+            "slow_calls": self.slow_calls,
+            "average_time": self.average_time,
+            "max_time": self.max_time
+        }
+
+
+class SlowOperationProfiler:
+    """
+    Times handler and sender invocations and reports the ones blocking the event loop.
+
+    Every measured operation is attributed to its kind and event name. Invocations longer than
+    the threshold are logged, and the slowest operations are kept in a top-N table.
+    The profiler can optionally emit trace spans through an OpenTelemetry-compatible tracer
+    (any object providing `start_as_current_span(name)`).
+
+    `measure` invokes an operation that may be a coroutine function and times only the steps running
+    on the event loop, so awaited I/O is not reported as blocking. `start` and `finish` time
+    a synchronous section of code.
+
+    When disabled, `start` returns None, `finish` returns immediately and `measure` just invokes
+    the operation, so the cost for instrumented code is a single attribute check.
+
+    Attributes:
+        _threshold (float): The duration (in seconds) after which an operation is considered slow.
+        _top_n (int): The number of entries reported by `top_operations`.
+        _enabled (bool): A flag indicating whether measurements are taken.
+        _tracer (Any): Optional tracer used for dispatch and fan-out spans.
+        _stats (dict[tuple[str, str], OperationStats]): Statistics mapped by (kind, event name).
+    """
+
+    def __init__(self, threshold: float = 0.05, top_n: int = 10, enabled: bool = True, tracer: Any = None):
+        """
+        Initializes the profiler.
+
+        Args:
+            threshold (float, optional): Slow operation threshold in seconds. Defaults to 0.05.
+            top_n (int, optional): Size of the top operations table. Defaults to 10.
+            enabled (bool, optional): Whether the profiler starts enabled. Defaults to True.
+            tracer (Any, optional): OpenTelemetry-compatible tracer for spans. Defaults to None.
+        """
+        if threshold < 0:
+            raise ValueError("Threshold must not be negative.")
+
+        if top_n <= 0:
+            raise ValueError("Top-N size must be greater than zero.")
+
+        self._threshold: float = threshold
+        self._top_n: int = top_n
+        self._enabled: bool = enabled
+        self._tracer: Any = tracer
+        self._stats: dict[tuple[str, str], OperationStats] = dict()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: Whether the profiler currently takes measurements.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        """
+        Toggles the profiler at runtime.
+
+        Args:
+            value (bool): True to enable measurements, False to disable them.
+        """
+        self._enabled = value
+
+    @property
+    def threshold(self) -> float:
+        """
+        Returns:
+            float: The slow operation threshold in seconds.
+        """
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: float) -> None:
+        """
+        Changes the slow operation threshold at runtime.
+
+        Args:
+            value (float): The new threshold in seconds.
+        """
+        if value < 0:
+            raise ValueError("Threshold must not be negative.")
+
+        self._threshold = value
+
+    def start(self) -> Optional[float]:
+        """
+        Marks the beginning of a measured operation.
+
+        Returns:
+            Optional[float]: The start time to be passed to `finish`, or None if the profiler is disabled.
+        """
+        if not self._enabled:
+            return None
+
+        return time.perf_counter()
+
+    async def measure(self, kind: str, event_name: str, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Invokes an operation and records the time it blocked the event loop.
+
+        The duration covers the call itself and, if it returns a coroutine, every step of the coroutine
+        between its awaits. Time spent waiting for awaited I/O is excluded. Invocations that raise
+        are recorded as well.
+
+        Args:
+            kind (str): The kind of the operation ('handler', 'sender', ...).
+            event_name (str): The event name the operation is attributed to.
+            function (Callable[..., Any]): The operation, synchronous or asynchronous.
+            *args (Any): The arguments of the operation.
+
+        Returns:
+            Any: The result of the operation.
+        """
+        if not self._enabled:
+            result = function(*args)
+
+            if asyncio.iscoroutine(result):
+                result = await result
+
+            return result
+
+        blocked = [0.0]
+
+        try:
+            started = time.perf_counter()
+
+            try:
+                result = function(*args)
+            finally:
+                blocked[0] += time.perf_counter() - started
+
+            if asyncio.iscoroutine(result):
+                result = await self._drive(result, blocked)
+
+            return result
+        finally:
+            self.record(kind, event_name, blocked[0])
+
+    @staticmethod
+    async def _drive(coroutine: Coroutine[Any, Any, Any], blocked: list[float]) -> Any:
+        """
+        Runs a coroutine step by step, summing the duration of the steps.
+
+        Args:
+            coroutine (Coroutine[Any, Any, Any]): The coroutine to be run.
+            blocked (list[float]): A single-item accumulator of the step durations in seconds.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        error: Optional[BaseException] = None
+
+        try:
+            while True:
+                started = time.perf_counter()
+
+                try:
+                    if error is None:
+                        awaited = coroutine.send(None)
+                    else:
+                        awaited = coroutine.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    blocked[0] += time.perf_counter() - started
+
+                error = None
+
+                # The coroutine awaits a future (or yields None to give up a loop iteration). Like in 'asyncio.Task',
+                # the blocking flag is reset before waiting. Once the future is done, the coroutine retrieves
+                # its result or exception by itself, only cancellation is passed in
+                try:
+                    if awaited is None:
+                        await asyncio.sleep(0)
+                    else:
+                        awaited._asyncio_future_blocking = False
+                        await awaited
+                except asyncio.CancelledError as e:
+                    error = e
+                except Exception:
+                    pass
+        except GeneratorExit:
+            coroutine.close()
+            raise
+
+    def finish(self, kind: str, event_name: str, started: Optional[float]) -> None:
+        """
+        Marks the end of a measured operation and records its duration.
+
+        Args:
+            kind (str): The kind of the operation ('handler', 'sender', ...).
+            event_name (str): The event name the operation is attributed to.
+            started (Optional[float]): The value returned by `start`.
+
+        Logs:
+            - Warning if the operation took longer than the threshold.
+        """
+        if started is None:
+            return
+
+        self.record(kind, event_name, time.perf_counter() - started)
+
+    def record(self, kind: str, event_name: str, elapsed: float) -> None:
+        """
+        Records the duration of an operation.
+
+        Args:
+            kind (str): The kind of the operation ('handler', 'sender', ...).
+            event_name (str): The event name the operation is attributed to.
+            elapsed (float): The time the operation blocked the event loop in seconds.
+
+        Logs:
+            - Warning if the operation took longer than the threshold.
+        """
+        key = (kind, event_name)
+        stats = self._stats.get(key)
+
+        if stats is None:
+            stats = OperationStats(kind, event_name)
+            self._stats[key] = stats
+
+        stats.calls += 1
+        stats.total_time += elapsed
+
+        if elapsed > stats.max_time:
+            stats.max_time = elapsed
+
+        if elapsed > self._threshold:
+            stats.slow_calls += 1
+            logger.warning(f"Slow {kind} for event {event_name}: {elapsed * 1000:.1f} ms blocked the event loop")
+
+    def span(self, name: str, event_name: str) -> ContextManager[Any]:
+        """
+        Creates a trace span for dispatch or fan-out of an event.
+
+        Args:
+            name (str): The span name, e.g. 'dispatch' or 'fanout'.
+            event_name (str): The event name attached to the span.
+
+        Returns:
+            ContextManager[Any]: The tracer span, or a no-op context if tracing is unavailable.
+        """
+        if not self._enabled or self._tracer is None:
+            return nullcontext()
+
+        return self._tracer.start_as_current_span(f"bounce_ws.{name} {event_name}")
+
+    def top_operations(self) -> list[OperationStats]:
+        """
+        Retrieves the slowest operations recorded so far.
+
+        Returns:
+            list[OperationStats]: Up to N operation statistics sorted by the longest invocation.
+        """
+        return sorted(self._stats.values(), key=lambda stats: stats.max_time, reverse=True)[:self._top_n]
+
+    def reset(self) -> None:
+        """
+        Discards all recorded statistics.
+        """
+        self._stats.clear()
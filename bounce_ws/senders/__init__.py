@@ -1,10 +1,15 @@
-from .abstract_sender import AbstractSender
+from .replay_buffer import ReplayBuffer
+from .abstract_sender import AbstractSender, RESYNC_REQUIRED_EVENT
 from .abstract_timed_sender import AbstractTimedSender
+from .abstract_streaming_sender import AbstractStreamingSender
 from .sender_orchestrator import SenderOrchestrator
 
 __all__ = [
+    "ReplayBuffer",
+    "RESYNC_REQUIRED_EVENT",
     "AbstractSender",
     "AbstractTimedSender",
+    "AbstractStreamingSender",
     "SenderOrchestrator"
 ]
 
@@ -1,10 +1,15 @@
 import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Coroutine, Union
+from typing import Any, Dict, Coroutine, Union, Optional
 
-from fastapi import WebSocket
-from loguru import logger
+from bounce_ws.codecs import AbstractCodec, JsonCodec
+from bounce_ws.monitoring import SlowOperationProfiler
+from bounce_ws.sessions import Priority, Session, intern_event
+from bounce_ws.senders import ReplayBuffer
+
+
+RESYNC_REQUIRED_EVENT = "resync_required"
 
 
 class AbstractSender(ABC):
@@ -14,15 +19,39 @@ class AbstractSender(ABC):
     This class provides a framework for sending structured JSON messages to connected WebSocket clients.
     Subclasses must implement the `event_name` and `create_message_data` methods.
 
+    Connections are tracked as `Session` objects. Subscription state lives in the session bitmask,
+    the sender only keeps a compact array of sessions for fan-out. Unsubscribed sessions are
+    skipped during fan-out and dropped from the array once they make up half of it.
+
+    Messages are queued to the sessions with the sender's `priority`, so a connection flushes
+    higher priority traffic before draining bulk streams.
+
+    If a replay buffer is enabled, every message carries a 'seq' key with its sequence number
+    and an 'epoch' key identifying the buffer, and the last messages are kept encoded so reconnecting clients can resume from them.
+
     Attributes:
-        _connections (set[WebSocket]): A private set storing active WebSocket connections.
+        _connections (list[Session]): A compact array of the sessions listed for this event.
+        _stale_count (int): The number of listed sessions that are no longer subscribed.
+        _event_bit (Optional[int]): The subscription bit of the interned event name.
+        _profiler (Optional[SlowOperationProfiler]): Profiler timing message creation, if attached.
+        _replay_buffer (Optional[ReplayBuffer]): Buffer of the last sent messages, if enabled.
+        _codec (AbstractCodec): The codec encoding the messages, JSON by default.
     """
 
-    def __init__(self):
+    def __init__(self, replay_buffer_size: int = 0):
         """
         Initializes the sender with an empty list of WebSocket connections.
+
+        Args:
+            replay_buffer_size (int, optional): The number of last messages kept for resuming clients,
+                                                0 disables the replay buffer. Defaults to 0.
         """
-        self._connections: set[WebSocket] = set()
+        self._connections: list[Session] = []
+        self._stale_count: int = 0
+        self._event_bit: Optional[int] = None
+        self._profiler: Optional[SlowOperationProfiler] = None
+        self._replay_buffer: Optional[ReplayBuffer] = ReplayBuffer(replay_buffer_size) if replay_buffer_size else None
+        self._codec: AbstractCodec = JsonCodec()
 
     @property
     @abstractmethod
@@ -38,6 +67,40 @@ class AbstractSender(ABC):
         """
         raise NotImplementedError("Must specify 'event_name' in inherited Sender")
 
+    @property
+    def priority(self) -> Priority:
+        """
+        Defines the priority class of the sender's messages.
+
+        Subclasses may override this property, control traffic should use HIGH or CRITICAL
+        and large periodic state streams BULK.
+
+        Returns:
+            Priority: The priority class, NORMAL by default.
+        """
+        return Priority.NORMAL
+
+    @property
+    def event_bit(self) -> int:
+        """
+        Retrieves the subscription bit of the event, interning the event name on first access.
+
+        Returns:
+            int: The bit of the event in `Session.subscriptions`.
+        """
+        if self._event_bit is None:
+            self._event_bit = 1 << intern_event(self.event_name)
+
+        return self._event_bit
+
+    @property
+    def connection_count(self) -> int:
+        """
+        Returns:
+            int: The number of sessions currently subscribed to the event.
+        """
+        return len(self._connections) - self._stale_count
+
     async def send(self) -> None:
         """
         Sends a JSON message to all connected WebSocket clients.
@@ -50,10 +113,15 @@ class AbstractSender(ABC):
         """
         timestamp = datetime.now().isoformat()
 
-        message_data = self.create_message_data()
+        profiler = self._profiler
+
+        if profiler is not None:
+            message_data = await profiler.measure("sender", self.event_name, self.create_message_data)
+        else:
+            message_data = self.create_message_data()
 
-        if asyncio.iscoroutine(message_data):
-            message_data = await message_data
+            if asyncio.iscoroutine(message_data):
+                message_data = await message_data
 
         message = {
             "event": self.event_name,
@@ -61,11 +129,94 @@ class AbstractSender(ABC):
             "timestamp": timestamp
         }
 
-        for connection in self._connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to send message: {e}")
+        replay_buffer = self._replay_buffer
+
+        if replay_buffer is None:
+            encoded = self.encode(message)
+        else:
+            sequence = replay_buffer.allocate()
+            message["seq"] = sequence
+            message["epoch"] = replay_buffer.epoch
+            encoded = self.encode(message)
+            replay_buffer.append(sequence, encoded)
+
+        if profiler is None:
+            await self._fan_out(encoded)
+            return
+
+        with profiler.span("fanout", self.event_name):
+            await self._fan_out(encoded)
+
+    async def _fan_out(self, encoded: str) -> None:
+        """
+        Queues an encoded message to every connected session.
+
+        Args:
+            encoded (str): The message encoded once for all connections.
+        """
+        event_bit = self.event_bit
+        priority = self.priority
+
+        for session in self._connections:
+            if session.subscriptions & event_bit:
+                session.send(encoded, priority)
+
+    def resume(self, session: Session, epoch: Optional[str], sequence: int) -> None:
+        """
+        Subscribes the session and replays the messages it missed after the specified sequence number.
+
+        If the epoch doesn't match the replay buffer (e.g. the server was restarted), the missed messages
+        are no longer buffered, or the replay buffer is disabled, the session receives a 'resync_required'
+        message instead and has to resynchronize its state.
+
+        Args:
+            session (Session): The session to be resumed.
+            epoch (Optional[str]): The epoch of the last message received by the client, None to force a resync.
+            sequence (int): The sequence number of the last message received by the client.
+        """
+        replay_buffer = self._replay_buffer
+        missed = replay_buffer.since(epoch, sequence) if replay_buffer is not None and epoch is not None else None
+
+        # Messages are queued synchronously, so the replayed ones always precede the next live message
+        self.add_connection(session)
+
+        if missed is None:
+            session.send(self.encode({
+                "event": RESYNC_REQUIRED_EVENT,
+                "data": {
+                    "event": self.event_name,
+                    "seq": replay_buffer.last_sequence if replay_buffer is not None else None,
+                    "epoch": replay_buffer.epoch if replay_buffer is not None else None
+                },
+                "timestamp": datetime.now().isoformat()
+            }), Priority.HIGH)
+            return
+
+        priority = self.priority
+
+        for encoded in missed:
+            session.send(encoded, priority)
+
+    def encode(self, message: Dict[str, Any]) -> str:
+        """
+        Encodes a message with the sender's codec.
+
+        Args:
+            message (Dict[str, Any]): The message to be encoded.
+
+        Returns:
+            str: The encoded message.
+        """
+        return self._codec.encode(message)
+
+    def set_codec(self, codec: AbstractCodec) -> None:
+        """
+        Sets the codec encoding the messages.
+
+        Args:
+            codec (AbstractCodec): The codec instance.
+        """
+        self._codec = codec
 
     @abstractmethod
     def create_message_data(self) -> Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]:
@@ -82,36 +233,79 @@ class AbstractSender(ABC):
         """
         raise NotImplementedError()
 
-    def add_connection(self, websocket: WebSocket) -> None:
+    def set_profiler(self, profiler: Optional[SlowOperationProfiler]) -> None:
         """
-        Adds a WebSocket connection to the sender.
+        Attaches a profiler that times `create_message_data` and traces fan-out.
 
         Args:
-            websocket (WebSocket): The WebSocket connection to be added.
+            profiler (Optional[SlowOperationProfiler]): The profiler instance, or None to detach.
         """
-        if websocket not in self._connections:
-            self._connections.add(websocket)
+        self._profiler = profiler
 
-    def remove_connection(self, websocket: WebSocket) -> None:
+    def add_connection(self, session: Session) -> None:
         """
-        Removes a WebSocket connection from the sender.
+        Adds a session to the sender.
 
         Args:
-            websocket (WebSocket): The WebSocket connection to be removed.
+            session (Session): The session to be added.
+        """
+        event_bit = self.event_bit
 
-        Raises:
-            ValueError: If the WebSocket connection is not found in the list.
+        if session.subscriptions & event_bit:
+            return
+
+        session.subscriptions |= event_bit
+
+        if session.listed & event_bit:
+            self._stale_count -= 1
+            return
+
+        session.listed |= event_bit
+        self._connections.append(session)
+
+    def remove_connection(self, session: Session) -> None:
         """
-        if websocket in self._connections:
-            self._connections.remove(websocket)
+        Removes a session from the sender.
+
+        The session stays in the array until enough sessions are unsubscribed to compact it.
 
-    def has_connection(self, websocket: WebSocket) -> bool:
+        Args:
+            session (Session): The session to be removed.
         """
-        Checks if the sender connected to the specified WebSocket.
+        event_bit = self.event_bit
+
+        if not session.subscriptions & event_bit:
+            return
+
+        session.subscriptions &= ~event_bit
+        self._stale_count += 1
+
+        if self._stale_count * 2 > len(self._connections):
+            self._compact()
+
+    def has_connection(self, session: Session) -> bool:
+        """
+        Checks if the sender connected to the specified session.
         Args:
-            websocket (WebSocket): The WebSocket connection to be checked.
+            session (Session): The session to be checked.
 
         Returns:
-            bool: if the WebSocket connection is found in the list.
+            bool: if the session is subscribed to the event.
         """
-        return websocket in self._connections
+        return session.is_subscribed(self.event_bit)
+
+    def _compact(self) -> None:
+        """
+        Drops unsubscribed sessions from the session array.
+        """
+        event_bit = self.event_bit
+        connections = []
+
+        for session in self._connections:
+            if session.subscriptions & event_bit:
+                connections.append(session)
+            else:
+                session.listed &= ~event_bit
+
+        self._connections = connections
+        self._stale_count = 0
@@ -0,0 +1,150 @@
+from abc import ABC
+import asyncio
+import sys
+import time
+import traceback
+from typing import Any, AsyncIterable, AsyncIterator, Optional, Union
+
+from loguru import logger
+
+from bounce_ws.senders import AbstractSender
+
+
+class AbstractStreamingSender(AbstractSender, ABC):
+    """
+    An abstract sender that pushes WebSocket messages as soon as new data is produced.
+
+    Unlike `AbstractTimedSender`, which polls `create_message_data` at a fixed framerate, this sender
+    broadcasts every item of an async iterator, async generator or `asyncio.Queue`. Subclasses either
+    pass the source to the constructor or override `stream`.
+
+    With a minimum interval, items produced faster than the interval are coalesced:
+    the first item is sent immediately, and only the latest of the following ones is sent
+    once the interval has passed.
+
+    Attributes:
+        _source (Optional[Union[AsyncIterable[Any], asyncio.Queue]]): The source of the message data.
+        _min_interval (float): The minimum time (in seconds) between two messages, 0 disables coalescing.
+        _is_active (bool): A flag indicating whether the sender is currently active.
+        _latest (Any): The latest produced item, used as the message data.
+        _pending (bool): A flag indicating whether the latest item is not sent yet.
+        _last_sent (float): The monotonic time of the latest message.
+        _flush_task (Optional[asyncio.Task]): The task sending the coalesced item, if any.
+    """
+
+    def __init__(self, source: Optional[Union[AsyncIterable[Any], asyncio.Queue]] = None, min_interval: float = 0,
+                 replay_buffer_size: int = 0):
+        """
+        Initializes the streaming sender with a given source.
+
+        Args:
+            source (Optional[Union[AsyncIterable[Any], asyncio.Queue]], optional): The async iterator, generator
+                or queue producing the message data. Defaults to None, in which case `stream` must be overridden.
+            min_interval (float, optional): The minimum time between two messages in seconds. Defaults to 0.
+            replay_buffer_size (int, optional): The number of last messages kept for resuming clients,
+                                                0 disables the replay buffer. Defaults to 0.
+        """
+        super().__init__(replay_buffer_size)
+
+        if min_interval < 0:
+            raise ValueError("Minimum interval must not be negative.")
+
+        self._source: Optional[Union[AsyncIterable[Any], asyncio.Queue]] = source
+        self._min_interval: float = min_interval
+        self._is_active: bool = True
+
+        self._latest: Any = None
+        self._pending: bool = False
+        self._last_sent: float = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def stream(self) -> AsyncIterator[Any]:
+        """
+        Produces the message data items.
+
+        Iterates the source passed to the constructor by default,
+        subclasses may override it with an async generator instead.
+
+        Yields:
+            Any: The message data items.
+
+        Raises:
+            NotImplementedError: If no source was passed and the method is not overridden.
+        """
+        if self._source is None:
+            raise NotImplementedError("Must pass 'source' or define 'stream' behaviour in inherited Sender")
+
+        if isinstance(self._source, asyncio.Queue):
+            while True:
+                yield await self._source.get()
+        else:
+            async for item in self._source:
+                yield item
+
+    def create_message_data(self) -> Any:
+        """
+        Returns the latest produced item, so calling `send` manually repeats the latest message.
+
+        Returns:
+            Any: The latest produced item, None if nothing was produced yet.
+        """
+        return self._latest
+
+    async def start(self) -> None:
+        """
+        Starts broadcasting the produced items.
+
+        This method sends the items until the source is exhausted or `stop` is called.
+        """
+        self._is_active = True
+
+        async for item in self.stream():
+            if not self._is_active:
+                break
+
+            self._latest = item
+
+            if self._min_interval <= 0:
+                await self.send()
+                continue
+
+            self._pending = True
+
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush())
+
+        if self._flush_task is not None:
+            await self._flush_task
+
+    def stop(self) -> None:
+        """
+        Stops broadcasting the produced items.
+
+        Sets the active flag to `False`, the sending loop stops on the next produced item.
+        """
+        self._is_active = False
+
+    async def _flush(self) -> None:
+        """
+        Sends the latest item as soon as the minimum interval since the previous message has passed.
+
+        Logs:
+            - Error if sending fails, the next produced item is sent regardless.
+        """
+        try:
+            while self._pending:
+                delay = self._last_sent + self._min_interval - time.monotonic()
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self._pending = False
+                self._last_sent = time.monotonic()
+
+                try:
+                    await self.send()
+                except Exception as e:
+                    logger.error(f"Error in streaming sender {self.event_name}: {e}")
+                    traceback.print_exc(file=sys.stdout)
+        finally:
+            self._flush_task = None
@@ -1,7 +1,9 @@
 from abc import ABC
 import asyncio
+from typing import Optional
 
 from bounce_ws.senders import AbstractSender
+from bounce_ws.sessions import Session
 
 
 class AbstractTimedSender(AbstractSender, ABC):
@@ -12,26 +14,57 @@ class AbstractTimedSender(AbstractSender, ABC):
     with a configurable frame rate. Subclasses must implement the required
     methods from `AbstractSender`.
 
+    The message is created once per tick, while each subscriber may receive it at its own lower rate:
+    a session with a divisor N gets every N-th tick. In adaptive mode the divisor of a session is doubled
+    while its outbound backlog exceeds the high watermark and halved back towards the requested one
+    once the backlog drops to the low watermark.
+
     Attributes:
+        _framerate (float): The number of ticks per second.
         _delay (float): The delay interval (in seconds) between each message send.
         _is_active (bool): A flag indicating whether the sender is currently active.
+        _tick (int): The number of ticks sent so far.
+        _adaptive (bool): A flag indicating whether the rates adapt to the subscribers' backlog.
+        _backlog_high (int): The backlog above which the rate of a session is lowered.
+        _backlog_low (int): The backlog at or below which the rate of a session is raised back.
+        _max_divisor (int): The largest divisor adaptive mode may lower a session to.
+        _divisors (dict[Session, list[int]]): [requested, current] divisors of the sessions
+                                              not receiving every tick.
     """
 
-    def __init__(self, framerate: float):
+    def __init__(self, framerate: float, replay_buffer_size: int = 0, adaptive: bool = False,
+                 backlog_high: int = 32, backlog_low: int = 4, max_divisor: int = 64):
         """
         Initializes the timed sender with a given frame rate.
 
         Args:
             framerate (float): The number of times messages should be sent per second.
+            replay_buffer_size (int, optional): The number of last messages kept for resuming clients,
+                                                0 disables the replay buffer. Defaults to 0.
+            adaptive (bool, optional): Whether subscriber rates adapt to their outbound backlog. Defaults to False.
+            backlog_high (int, optional): The backlog above which a session rate is lowered. Defaults to 32.
+            backlog_low (int, optional): The backlog at which a session rate is raised back. Defaults to 4.
+            max_divisor (int, optional): The largest tick divisor in adaptive mode. Defaults to 64.
         """
-        super().__init__()
+        super().__init__(replay_buffer_size)
 
         if framerate <= 0:
             raise ValueError("Framerate must be greater than zero.")
 
+        if backlog_low > backlog_high:
+            raise ValueError("Low backlog watermark must not exceed the high one.")
+
+        self._framerate: float = framerate
         self._delay: float = 1 / framerate
         self._is_active: bool = True
 
+        self._tick: int = 0
+        self._adaptive: bool = adaptive
+        self._backlog_high: int = backlog_high
+        self._backlog_low: int = backlog_low
+        self._max_divisor: int = max_divisor
+        self._divisors: dict[Session, list[int]] = dict()
+
 
     async def start(self) -> None:
         """
@@ -54,3 +87,100 @@ class AbstractTimedSender(AbstractSender, ABC):
         Sets the active flag to `False`, stopping the sending loop gracefully.
         """
         self._is_active = False
+
+    def set_rate(self, session: Session, rate: Optional[float]) -> None:
+        """
+        Sets the desired message rate of a subscriber.
+
+        The rate is rounded to a whole divisor of the sender's framerate and
+        can't be higher than the framerate itself.
+
+        Args:
+            session (Session): The subscribed session.
+            rate (Optional[float]): The desired number of messages per second, None for the full framerate.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate must be greater than zero.")
+
+        divisor = 1 if rate is None else max(1, round(self._framerate / rate))
+
+        if divisor == 1:
+            self._divisors.pop(session, None)
+            return
+
+        self._divisors[session] = [divisor, divisor]
+
+    def get_rate(self, session: Session) -> float:
+        """
+        Retrieves the current message rate of a subscriber.
+
+        Args:
+            session (Session): The subscribed session.
+
+        Returns:
+            float: The number of messages per second the session currently receives.
+        """
+        divisors = self._divisors.get(session)
+        return self._framerate if divisors is None else self._framerate / divisors[1]
+
+    def remove_connection(self, session: Session) -> None:
+        """
+        Removes a session from the sender together with its rate settings.
+
+        Args:
+            session (Session): The session to be removed.
+        """
+        super().remove_connection(session)
+        self._divisors.pop(session, None)
+
+    async def _fan_out(self, encoded: str) -> None:
+        """
+        Queues an encoded message to every connected session whose rate includes the current tick.
+
+        Args:
+            encoded (str): The message encoded once for all connections.
+        """
+        tick = self._tick
+        self._tick += 1
+
+        if not self._divisors and not self._adaptive:
+            await super()._fan_out(encoded)
+            return
+
+        event_bit = self.event_bit
+        priority = self.priority
+        divisors_dict = self._divisors
+
+        for session in self._connections:
+            if not session.subscriptions & event_bit:
+                continue
+
+            divisors = divisors_dict.get(session)
+
+            if self._adaptive:
+                if divisors is None:
+                    if session.backlog <= self._backlog_high:
+                        session.send(encoded, priority)
+                        continue
+
+                    divisors = [1, 1]
+                    divisors_dict[session] = divisors
+
+                if tick % divisors[1]:
+                    continue
+
+                backlog = session.backlog
+
+                if backlog > self._backlog_high:
+                    divisors[1] = min(divisors[1] * 2, self._max_divisor)
+                elif backlog <= self._backlog_low and divisors[1] > divisors[0]:
+                    divisors[1] = max(divisors[0], divisors[1] // 2)
+
+                    if divisors[1] == 1:
+                        del divisors_dict[session]
+
+                session.send(encoded, priority)
+                continue
+
+            if divisors is None or not tick % divisors[1]:
+                session.send(encoded, priority)
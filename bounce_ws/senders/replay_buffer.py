@@ -0,0 +1,105 @@
+import uuid
+from collections import deque
+from typing import Optional
+
+
+class ReplayBuffer:
+    """
+    A bounded ring buffer of the last encoded messages of a sender.
+
+    Every message gets a monotonically increasing sequence number, which lets reconnecting
+    clients request the messages they missed instead of resynchronizing the full state.
+    Sequence numbers restart with every buffer, e.g. after a server restart, so they are only
+    meaningful together with the random epoch identifying the buffer.
+
+    Attributes:
+        _size (int): The maximum number of stored messages.
+        _epoch (str): The random identifier of the sequence number stream.
+        _last_sequence (int): The sequence number of the latest allocated message, 0 if none.
+        _entries (deque[tuple[int, str]]): Stored (sequence number, encoded message) pairs.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initializes an empty buffer.
+
+        Args:
+            size (int): The maximum number of stored messages.
+        """
+        if size <= 0:
+            raise ValueError("Replay buffer size must be greater than zero.")
+
+        self._size: int = size
+        self._epoch: str = uuid.uuid4().hex[:16]
+        self._last_sequence: int = 0
+        self._entries: deque[tuple[int, str]] = deque(maxlen=size)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:
+            int: The maximum number of stored messages.
+        """
+        return self._size
+
+    @property
+    def epoch(self) -> str:
+        """
+        Returns:
+            str: The random identifier of the sequence number stream.
+        """
+        return self._epoch
+
+    @property
+    def last_sequence(self) -> int:
+        """
+        Returns:
+            int: The sequence number of the latest allocated message, 0 if none.
+        """
+        return self._last_sequence
+
+    def allocate(self) -> int:
+        """
+        Allocates the sequence number for the next message.
+
+        Returns:
+            int: The allocated sequence number.
+        """
+        self._last_sequence += 1
+        return self._last_sequence
+
+    def append(self, sequence: int, message: str) -> None:
+        """
+        Stores an encoded message, evicting the oldest one if the buffer is full.
+
+        Args:
+            sequence (int): The sequence number allocated for the message.
+            message (str): The encoded message.
+        """
+        self._entries.append((sequence, message))
+
+    def since(self, epoch: str, sequence: int) -> Optional[list[str]]:
+        """
+        Retrieves the messages following the specified sequence number.
+
+        Args:
+            epoch (str): The epoch of the last message received by the client.
+            sequence (int): The sequence number of the last message received by the client.
+
+        Returns:
+            Optional[list[str]]: The encoded messages in order, or None if the epoch doesn't match or some
+            of the missed messages were already evicted, so the client has to resynchronize.
+        """
+        if epoch != self._epoch:
+            return None
+
+        if sequence == self._last_sequence:
+            return []
+
+        if sequence > self._last_sequence or sequence < 0:
+            return None
+
+        if not self._entries or self._entries[0][0] > sequence + 1:
+            return None
+
+        return [message for message_sequence, message in self._entries if message_sequence > sequence]
@@ -1,9 +1,14 @@
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 
 from loguru import logger
-from fastapi import WebSocket
 
-from bounce_ws.senders import AbstractSender
+from bounce_ws.codecs import AbstractCodec, JsonCodec
+from bounce_ws.monitoring import SlowOperationProfiler
+from bounce_ws.sessions import Session
+
+if TYPE_CHECKING:
+    from bounce_ws.graph import ComputationGraph
+from bounce_ws.senders import AbstractSender, AbstractTimedSender
 
 class SenderOrchestrator:
     """
@@ -14,6 +19,9 @@ class SenderOrchestrator:
 
     Attributes:
         _senders_dict (dict[str, AbstractSender]): A dictionary storing senders mapped by event names.
+        _profiler (Optional[SlowOperationProfiler]): Profiler attached to every registered sender.
+        _graphs (list[ComputationGraph]): Computation graphs driving registered senders.
+        _codec (AbstractCodec): The codec set to every registered sender.
     """
 
     def __init__(self):
@@ -21,6 +29,9 @@ class SenderOrchestrator:
         Initializes the orchestrator with an empty sender registry.
         """
         self._senders_dict: dict[str, AbstractSender] = {}
+        self._profiler: Optional[SlowOperationProfiler] = None
+        self._graphs: list["ComputationGraph"] = []
+        self._codec: AbstractCodec = JsonCodec()
 
     @property
     def registered_events(self) -> list[str]:
@@ -42,6 +53,16 @@ class SenderOrchestrator:
         """
         return list(self._senders_dict.values())
 
+    @property
+    def graphs(self) -> list["ComputationGraph"]:
+        """
+        Retrieves the list of registered computation graphs.
+
+        Returns:
+            list[ComputationGraph]: A list of registered graphs.
+        """
+        return list(self._graphs)
+
     def get_sender(self, event_name: str) -> Optional[AbstractSender]:
         """
         Retrieves a sender by event name.
@@ -60,7 +81,7 @@ class SenderOrchestrator:
         Registers a sender instance for its associated event name.
 
         If a sender for the event already exists, the registration is ignored, and
-        an error message is logged.
+        an error message is logged. The event name is interned on registration.
 
         Args:
             sender (AbstractSender): The sender instance to be registered.
@@ -73,6 +94,12 @@ class SenderOrchestrator:
             return
 
         self._senders_dict[sender.event_name] = sender
+        sender.set_codec(self._codec)
+        # Intern the event name so the subscription bit is assigned at registration
+        _ = sender.event_bit
+
+        if self._profiler is not None:
+            sender.set_profiler(self._profiler)
 
 
     def unregister_sender(self, sender: AbstractSender) -> None:
@@ -99,12 +126,71 @@ class SenderOrchestrator:
 
         del self._senders_dict[sender.event_name]
 
-    def subscribe(self, websocket: WebSocket, data: dict[str, Any]) -> None:
+    def register_graph(self, graph: "ComputationGraph") -> None:
         """
-        Subscribes websocket to the senders with specified events
+        Registers a computation graph together with all senders it drives, including the ones added later.
+
+        The graph is started and stopped with the application like timed senders.
 
         Args:
-            websocket: websocket instance to be subscribed
+            graph (ComputationGraph): The graph to be registered.
+
+        Logs:
+            - Error if the graph is already registered.
+        """
+        if graph in self._graphs:
+            logger.error("Computation graph is already registered, ignoring...")
+            return
+
+        self._graphs.append(graph)
+        graph.set_orchestrator(self)
+
+        for sender in graph.senders:
+            self.register_sender(sender)
+
+        if self._profiler is not None:
+            graph.set_profiler(self._profiler)
+
+    def set_profiler(self, profiler: Optional[SlowOperationProfiler]) -> None:
+        """
+        Attaches a profiler to all registered senders and to the ones registered later.
+
+        Args:
+            profiler (Optional[SlowOperationProfiler]): The profiler instance, or None to detach.
+        """
+        self._profiler = profiler
+
+        for sender in self._senders_dict.values():
+            sender.set_profiler(profiler)
+
+        for graph in self._graphs:
+            graph.set_profiler(profiler)
+
+    def set_codec(self, codec: AbstractCodec) -> None:
+        """
+        Sets the codec of all registered senders and of the ones registered later.
+
+        Args:
+            codec (AbstractCodec): The codec instance.
+        """
+        self._codec = codec
+
+        for sender in self._senders_dict.values():
+            sender.set_codec(codec)
+
+    def subscribe(self, session: Session, data: dict[str, Any]) -> None:
+        """
+        Subscribes session to the senders with specified events
+
+        If 'resume_from' mapping of event names to the last received positions ({"epoch": ..., "seq": ...})
+        is specified, the messages missed after those positions are replayed from the senders' replay buffers.
+        Malformed positions make the client resynchronize.
+
+        If 'rates' mapping of event names to messages per second is specified, timed senders deliver
+        their messages to the session at the requested rate instead of their full framerate.
+
+        Args:
+            session: session of the connection to be subscribed
             data: contents of the 'subscribe' event message
         """
         events: list[str] = data.get("events")
@@ -113,26 +199,54 @@ class SenderOrchestrator:
             logger.warning('No events specified in "subscribe" event')
             return
 
+        resume_from: dict[str, dict[str, Any]] = data.get("resume_from") or dict()
+        rates: dict[str, float] = data.get("rates") or dict()
+
         if "*" in events:
-            for sender in self._senders_dict.values():
-                if not sender.has_connection(websocket):
-                    sender.add_connection(websocket)
-            return
+            senders = list(self._senders_dict.values())
+        else:
+            senders = [self._senders_dict[event] for event in events]
 
-        for event in events:
-            sender = self._senders_dict[event]
+        if not isinstance(resume_from, dict):
+            # Every requested sender is resumed from the malformed position and resynchronized
+            resume_from = {sender.event_name: resume_from for sender in senders}
+
+        if not isinstance(rates, dict):
+            logger.warning('Invalid "rates" in "subscribe" event, ignoring requested rates')
+            rates = dict()
+
+        for sender in senders:
+            position = resume_from.get(sender.event_name)
 
-            if not sender.has_connection(websocket):
-                sender.add_connection(websocket)
+            if position is not None:
+                epoch, sequence = self._parse_position(sender.event_name, position)
+                sender.resume(session, epoch, sequence)
+            elif not sender.has_connection(session):
+                sender.add_connection(session)
 
-    def unsubscribe(self, websocket: WebSocket, data: dict[str, Any]) -> None:
+            if sender.event_name not in rates:
+                continue
+
+            rate = rates[sender.event_name]
+
+            if not isinstance(sender, AbstractTimedSender):
+                logger.warning(f"Sender for event {sender.event_name} is not timed, ignoring requested rate")
+            elif rate is not None and (not isinstance(rate, (int, float)) or isinstance(rate, bool) or not rate > 0):
+                logger.warning(f"Invalid rate {rate!r} requested for event {sender.event_name}, ignoring it")
+            else:
+                sender.set_rate(session, rate)
+
+    def unsubscribe(self, session: Session, data: Optional[dict[str, Any]] = None) -> None:
         """
-        Unsubscribes websocket from the senders with specified events
+        Unsubscribes session from the senders with specified events
 
         Args:
-            websocket: websocket instance to be unsubscribed
-            data: contents of the 'unsubscribe' event message
+            session: session of the connection to be unsubscribed
+            data: contents of the 'unsubscribe' event message, unsubscribes from all events if None
         """
+        if data is None:
+            data = {"events": ["*"]}
+
         events: list[str] = data.get("events")
 
         if events is None:
@@ -141,13 +255,37 @@ class SenderOrchestrator:
 
         if "*" in events:
             for sender in self._senders_dict.values():
-                if sender.has_connection(websocket):
-                    sender.remove_connection(websocket)
+                if sender.has_connection(session):
+                    sender.remove_connection(session)
             return
 
         for event in events:
             sender = self._senders_dict[event]
 
-            if sender.has_connection(websocket):
-                sender.remove_connection(websocket)
+            if sender.has_connection(session):
+                sender.remove_connection(session)
+
+    @staticmethod
+    def _parse_position(event_name: str, position: Any) -> tuple[Optional[str], int]:
+        """
+        Validates a position a client wants to resume from.
+
+        Args:
+            event_name (str): The event name of the position.
+            position (Any): The position from the 'resume_from' mapping, expected as {"epoch": str, "seq": int}.
+
+        Returns:
+            tuple[Optional[str], int]: The epoch and the sequence number, the epoch is None if the position is malformed.
+
+        Logs:
+            - Warning if the position is malformed.
+        """
+        if isinstance(position, dict):
+            epoch = position.get("epoch")
+            sequence = position.get("seq")
+
+            if isinstance(epoch, str) and isinstance(sequence, int) and not isinstance(sequence, bool):
+                return epoch, sequence
 
+        logger.warning(f"Invalid resume position for event {event_name}, resynchronizing")
+        return None, 0
@@ -0,0 +1,12 @@
+from .priority import Priority
+from .outbound_metrics import OutboundMetrics
+from .session import Session, intern_event
+
+__all__ = [
+    "Priority",
+    "OutboundMetrics",
+    "Session",
+    "intern_event"
+]
+
+__version__ = "0.9.9"
@@ -0,0 +1,110 @@
+from collections import deque
+from typing import Any
+
+from bounce_ws.sessions.priority import Priority
+
+
+class OutboundMetrics:
+    """
+    Collects outbound queueing latency per priority class.
+
+    The latency of a message is the time between enqueueing it to a session and
+    finishing its transmission over the WebSocket.
+
+    Attributes:
+        _sample_size (int): The number of latest samples kept per priority class.
+        _enabled (bool): A flag indicating whether samples are recorded.
+        _samples (list[deque[float]]): The latest latency samples indexed by priority.
+        _counts (list[int]): The number of sent messages indexed by priority.
+    """
+
+    def __init__(self, sample_size: int = 1024, enabled: bool = True):
+        """
+        Initializes the metrics with empty samples.
+
+        Args:
+            sample_size (int, optional): The number of latest samples kept per class. Defaults to 1024.
+            enabled (bool, optional): Whether samples are recorded from the start. Defaults to True.
+        """
+        if sample_size <= 0:
+            raise ValueError("Sample size must be greater than zero.")
+
+        self._sample_size: int = sample_size
+        self._enabled: bool = enabled
+        self._samples: list[deque[float]] = [deque(maxlen=sample_size) for _ in Priority]
+        self._counts: list[int] = [0 for _ in Priority]
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: Whether samples are currently recorded.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        """
+        Toggles sample recording at runtime.
+
+        Args:
+            value (bool): True to record samples, False to skip them.
+        """
+        self._enabled = value
+
+    def record(self, priority: int, latency: float) -> None:
+        """
+        Records the latency of a sent message.
+
+        Args:
+            priority (int): The priority class of the message.
+            latency (float): The time from enqueueing to sending completion in seconds.
+        """
+        self._samples[priority].append(latency)
+        self._counts[priority] += 1
+
+    def percentile(self, priority: Priority, percent: float) -> float:
+        """
+        Computes a latency percentile over the latest samples of a priority class.
+
+        Args:
+            priority (Priority): The priority class.
+            percent (float): The percentile in the range [0, 100].
+
+        Returns:
+            float: The latency percentile in seconds, 0 if there are no samples.
+        """
+        samples = sorted(self._samples[priority])
+
+        if not samples:
+            return 0.0
+
+        index = min(len(samples) - 1, int(len(samples) * percent / 100))
+        return samples[index]
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Summarizes the latency of every priority class.
+
+        Returns:
+            dict[str, dict[str, Any]]: Sent message count, p50, p99 and max latency (in seconds)
+            mapped by lowercase priority class name.
+        """
+        return {
+            priority.name.lower(): {
+                "count": self._counts[priority],
+                "p50": self.percentile(priority, 50),
+                "p99": self.percentile(priority, 99),
+                "max": max(self._samples[priority], default=0.0)
+            }
+            for priority in Priority
+        }
+
+    def reset(self) -> None:
+        """
+        Discards all recorded samples.
+        """
+        for samples in self._samples:
+            samples.clear()
+
+        self._counts = [0 for _ in Priority]
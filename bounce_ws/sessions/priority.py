@@ -0,0 +1,17 @@
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """
+    Priority classes of outbound messages, lower values are flushed first.
+
+    Attributes:
+        CRITICAL: Alerts and other messages that must never wait behind other traffic.
+        HIGH: Control traffic such as handler replies and resynchronization notices.
+        NORMAL: Regular event messages, the default for senders.
+        BULK: Large or frequent state streams that are sent only when nothing else is queued.
+    """
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    BULK = 3
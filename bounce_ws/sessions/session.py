@@ -0,0 +1,267 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional, TYPE_CHECKING
+
+from fastapi import WebSocket
+from loguru import logger
+
+from bounce_ws.sessions.priority import Priority
+from bounce_ws.sessions.outbound_metrics import OutboundMetrics
+
+if TYPE_CHECKING:
+    from bounce_ws.capture import TrafficRecorder
+
+
+_event_ids: dict[str, int] = dict()
+
+
+def intern_event(event_name: str) -> int:
+    """
+    Interns an event name and returns its numeric identifier.
+
+    Identifiers are assigned sequentially and never reused, so they can be used
+    as bit positions in the subscription masks of `Session` objects.
+
+    Args:
+        event_name (str): The event name to be interned.
+
+    Returns:
+        int: The identifier of the event.
+    """
+    event_id = _event_ids.get(event_name)
+
+    if event_id is None:
+        event_id = len(_event_ids)
+        _event_ids[event_name] = event_id
+
+    return event_id
+
+
+class Session:
+    """
+    A compact per-connection state object.
+
+    Subscriptions are stored as an integer bitmask over interned event identifiers instead of
+    per-sender sets of WebSocket objects. A second mask tracks in which per-event session arrays
+    the session is currently listed, which allows senders to remove it lazily.
+
+    Outbound messages are queued into per-priority lanes and written by a single writer task,
+    which always flushes higher priority lanes before draining lower ones. Lanes and the writer
+    exist only while messages are queued, so idle connections do not pay for them.
+
+    The backlog of a slow client is capped. When it is full, the oldest BULK and then NORMAL messages
+    are dropped to make room, and a NORMAL or BULK message is dropped itself if there is no lower
+    priority message to replace. If a HIGH or CRITICAL message can't be queued, the connection is closed.
+
+    Memory per connection (CPython 3.11, 64-bit) is 128 bytes for the idle session itself. Masks over
+    the first 8 interned events are cached small ints, beyond that each mask takes 28-36 bytes for
+    up to 60 events. Every subscribed event adds one 8 byte pointer in the sender's session array.
+
+    Attributes:
+        id (int): The identifier of the connection.
+        websocket (WebSocket): The underlying WebSocket connection.
+        subscriptions (int): Bitmask of the subscribed event identifiers.
+        listed (int): Bitmask of the events whose session arrays contain this session.
+        _lanes (Optional[list[deque[tuple[str, float]]]]): Queued (message, enqueue time) pairs indexed by priority.
+        _backlog (int): The number of queued messages.
+        _writer (Optional[asyncio.Task]): The task writing queued messages, or closing the connection
+            of a closed session, if any.
+        _metrics (Optional[OutboundMetrics]): Metrics collecting the outbound latency, if attached.
+        _recorder (Optional[TrafficRecorder]): Recorder capturing outbound messages, if attached.
+        _max_backlog (int): The maximum number of queued messages.
+        _dropped (int): The number of messages dropped because the backlog was full.
+        _closed (bool): A flag indicating whether the connection is closed.
+    """
+    __slots__ = ("id", "websocket", "subscriptions", "listed", "_lanes", "_backlog", "_writer", "_metrics",
+                 "_recorder", "_max_backlog", "_dropped", "_closed")
+
+    def __init__(self, websocket: WebSocket, session_id: int = 0, metrics: Optional[OutboundMetrics] = None,
+                 recorder: Optional["TrafficRecorder"] = None, max_backlog: int = 1024):
+        """
+        Initializes the session without any subscriptions.
+
+        Args:
+            websocket (WebSocket): The WebSocket connection of the session.
+            session_id (int, optional): The identifier of the connection. Defaults to 0.
+            metrics (Optional[OutboundMetrics], optional): Metrics collecting the outbound latency. Defaults to None.
+            recorder (Optional[TrafficRecorder], optional): Recorder capturing outbound messages. Defaults to None.
+            max_backlog (int, optional): The maximum number of queued messages. Defaults to 1024.
+        """
+        if max_backlog <= 0:
+            raise ValueError("Maximum backlog must be greater than zero.")
+
+        self.id: int = session_id
+        self.websocket: WebSocket = websocket
+        self.subscriptions: int = 0
+        self.listed: int = 0
+        self._lanes: Optional[list[deque[tuple[str, float]]]] = None
+        self._backlog: int = 0
+        self._writer: Optional[asyncio.Task] = None
+        self._metrics: Optional[OutboundMetrics] = metrics
+        self._recorder: Optional["TrafficRecorder"] = recorder
+        self._max_backlog: int = max_backlog
+        self._dropped: int = 0
+        self._closed: bool = False
+
+    @property
+    def backlog(self) -> int:
+        """
+        Returns:
+            int: The number of messages queued for sending.
+        """
+        return self._backlog
+
+    @property
+    def dropped(self) -> int:
+        """
+        Returns:
+            int: The number of messages dropped because the backlog was full.
+        """
+        return self._dropped
+
+    def is_subscribed(self, event_bit: int) -> bool:
+        """
+        Checks if the session is subscribed to the event.
+
+        Args:
+            event_bit (int): The bit of the event, i.e. `1 << event_id`.
+
+        Returns:
+            bool: if the session is subscribed to the event.
+        """
+        return bool(self.subscriptions & event_bit)
+
+    def send(self, message: str, priority: Priority = Priority.NORMAL) -> None:
+        """
+        Queues an encoded message for sending without waiting for the transmission.
+
+        If the backlog is full, lower priority messages are dropped or the connection is closed.
+
+        Args:
+            message (str): The encoded message.
+            priority (Priority, optional): The priority class of the message. Defaults to NORMAL.
+        """
+        if self._closed:
+            return
+
+        if self._backlog >= self._max_backlog and not self._shed(priority):
+            return
+
+        if self._recorder is not None:
+            self._recorder.record_outbound(self.id, message)
+
+        if self._lanes is None:
+            self._lanes = [deque() for _ in Priority]
+
+        self._lanes[priority].append((message, time.perf_counter()))
+        self._backlog += 1
+
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write())
+
+    def _shed(self, priority: Priority) -> bool:
+        """
+        Makes room in a full backlog for a message.
+
+        Args:
+            priority (Priority): The priority class of the message to be queued.
+
+        Returns:
+            bool: True if the message can be queued, False if it has to be dropped.
+
+        Logs:
+            - Warning when messages start being dropped and then once per `max_backlog` dropped messages.
+            - Warning if the connection is closed.
+        """
+        lanes = self._lanes
+
+        for lane_priority in (Priority.BULK, Priority.NORMAL):
+            # A message never replaces one of higher priority
+            if lane_priority < priority:
+                break
+
+            if lanes[lane_priority]:
+                lanes[lane_priority].popleft()
+                self._backlog -= 1
+                self._count_dropped()
+                return True
+
+        if priority >= Priority.NORMAL:
+            self._count_dropped()
+            return False
+
+        logger.warning(f"Backlog of session {self.id} is full of high priority messages, closing the connection")
+        self.close()
+
+        if self.websocket is not None:
+            # The writer slot is free once the session is closed, keeping the task referenced until it completes
+            self._writer = asyncio.create_task(self._disconnect())
+
+        return False
+
+    def _count_dropped(self) -> None:
+        """
+        Counts a message dropped because the backlog was full.
+        """
+        self._dropped += 1
+
+        if self._dropped % self._max_backlog == 1 or self._max_backlog == 1:
+            logger.warning(f"Backlog of session {self.id} is full, {self._dropped} messages dropped so far")
+
+    async def _disconnect(self) -> None:
+        """
+        Closes the WebSocket connection of a client that can't keep up.
+        """
+        try:
+            await self.websocket.close(code=1013)
+        except Exception as e:
+            logger.error(f"Failed to close connection: {e}")
+        finally:
+            self._writer = None
+
+    async def _write(self) -> None:
+        """
+        Writes queued messages, always taking the highest priority one first, until all lanes are empty.
+        """
+        lanes = self._lanes
+
+        try:
+            while self._backlog:
+                for priority, lane in enumerate(lanes):
+                    if lane:
+                        break
+
+                message, enqueued = lane.popleft()
+                self._backlog -= 1
+
+                await self.websocket.send_text(message)
+
+                metrics = self._metrics
+                if metrics is not None and metrics.enabled:
+                    metrics.record(priority, time.perf_counter() - enqueued)
+        except Exception as e:
+            logger.error(f"Failed to send message: {e}")
+            self.close()
+        finally:
+            self._writer = None
+
+            if not self._backlog:
+                self._lanes = None
+
+    def close(self) -> None:
+        """
+        Marks the connection closed and discards all queued messages.
+
+        Closing an already closed session does nothing, so a pending disconnect isn't cancelled.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        self._lanes = None
+        self._backlog = 0
+
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+            self._writer = None
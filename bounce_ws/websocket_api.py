@@ -1,9 +1,9 @@
 import asyncio
 import datetime
-import json
+import itertools
 from contextlib import asynccontextmanager
 from threading import Thread
-from typing import Optional, Any, AsyncGenerator
+from typing import Optional, Any, AsyncGenerator, Iterator, Union
 import traceback
 import sys
 
@@ -11,8 +11,12 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from loguru import logger
 import uvicorn
 
-from .senders import AbstractTimedSender, SenderOrchestrator
-from .handlers import HandlerOrchestrator
+from .senders import AbstractStreamingSender, AbstractTimedSender, SenderOrchestrator
+from .handlers import HandlerOrchestrator, RPC_EVENT, RPC_CANCEL_EVENT
+from .monitoring import LoopLagMonitor, SlowOperationProfiler
+from .sessions import OutboundMetrics, Session
+from .capture import Direction, TrafficRecorder
+from .codecs import AbstractCodec, JsonCodec
 
 
 class WebSocketApi:
@@ -24,7 +28,13 @@ class WebSocketApi:
     """
 
     def __init__(self, app: FastAPI, sender_orchestrator: SenderOrchestrator, handler_orchestrator: HandlerOrchestrator,
-                 host: str = "localhost", port: int = 8080, name: str = 'Websocket API', route: str = '/ws') -> None:
+                 host: str = "localhost", port: int = 8080, name: str = 'Websocket API', route: str = '/ws',
+                 profiler: Optional[SlowOperationProfiler] = None,
+                 loop_lag_monitor: Optional[LoopLagMonitor] = None,
+                 outbound_metrics: Optional[OutboundMetrics] = None,
+                 recorder: Optional[TrafficRecorder] = None,
+                 codec: Optional[AbstractCodec] = None,
+                 max_backlog: int = 1024) -> None:
         """
         Initializes the WebSocketApi instance with the given FastAPI app and orchestrators.
 
@@ -36,6 +46,18 @@ class WebSocketApi:
             port (int, optional): The port number for the server. Defaults to 8080.
             name (str, optional): The server name for logging. Defaults to 'Websocket API'.
             route (str, optional): The WebSocket route to attach. Defaults to '/ws'.
+            profiler (Optional[SlowOperationProfiler], optional): Profiler timing every handler and sender
+                invocation. Defaults to None.
+            loop_lag_monitor (Optional[LoopLagMonitor], optional): Event loop lag probe running during
+                the application lifespan. Defaults to None.
+            outbound_metrics (Optional[OutboundMetrics], optional): Metrics collecting outbound latency
+                per priority class. Defaults to None.
+            recorder (Optional[TrafficRecorder], optional): Recorder capturing inbound and outbound
+                messages to a traffic log. Defaults to None.
+            codec (Optional[AbstractCodec], optional): The codec of inbound and outbound messages.
+                Defaults to JsonCodec.
+            max_backlog (int, optional): The maximum number of messages queued per connection, lower priority
+                messages of slow clients are dropped beyond it. Defaults to 1024.
         """
         self._app: FastAPI = app
         self._app.router.lifespan_context = self.lifespan
@@ -49,9 +71,55 @@ class WebSocketApi:
         self.__sender_orchestrator: SenderOrchestrator = sender_orchestrator
         self.__handler_orchestrator: HandlerOrchestrator = handler_orchestrator
 
+        self.__profiler: Optional[SlowOperationProfiler] = profiler
+        self.__loop_lag_monitor: Optional[LoopLagMonitor] = loop_lag_monitor
+        self.__outbound_metrics: Optional[OutboundMetrics] = outbound_metrics
+        self.__recorder: Optional[TrafficRecorder] = recorder
+        self.__session_ids: Iterator[int] = itertools.count(1)
+        self.__max_backlog: int = max_backlog
+
+        self.__codec: AbstractCodec = codec if codec is not None else JsonCodec()
+        self.__sender_orchestrator.set_codec(self.__codec)
+        self.__handler_orchestrator.set_codec(self.__codec)
+
+        if profiler is not None:
+            self.__sender_orchestrator.set_profiler(profiler)
+            self.__handler_orchestrator.set_profiler(profiler)
+
         self.__thread: Optional[Thread] = None
         self.__server: Optional[uvicorn.Server] = None
 
+    @property
+    def profiler(self) -> Optional[SlowOperationProfiler]:
+        """
+        Returns:
+            Optional[SlowOperationProfiler]: The attached slow operation profiler, if any.
+        """
+        return self.__profiler
+
+    @property
+    def loop_lag_monitor(self) -> Optional[LoopLagMonitor]:
+        """
+        Returns:
+            Optional[LoopLagMonitor]: The attached event loop lag monitor, if any.
+        """
+        return self.__loop_lag_monitor
+
+    @property
+    def outbound_metrics(self) -> Optional[OutboundMetrics]:
+        """
+        Returns:
+            Optional[OutboundMetrics]: The attached outbound latency metrics, if any.
+        """
+        return self.__outbound_metrics
+
+    @property
+    def recorder(self) -> Optional[TrafficRecorder]:
+        """
+        Returns:
+            Optional[TrafficRecorder]: The attached traffic recorder, if any.
+        """
+        return self.__recorder
 
     def start(self, background: bool = False) -> None:
         """
@@ -97,12 +165,22 @@ class WebSocketApi:
     def stop(self) -> None:
         """
         Stops the running WebSocket server gracefully.
+
+        The traffic recorder, if attached, is closed once the server thread finishes,
+        or flushed if the server is still shutting down.
         """
         if self.__server is None:
             return
 
         self.__server.should_exit = True
         self.__thread.join(timeout=1)
+
+        if self.__recorder is not None:
+            if self.__thread.is_alive():
+                self.__recorder.flush()
+            else:
+                self.__recorder.close()
+
         logger.info(f'{self._name} server stopped')
 
 
@@ -111,37 +189,76 @@ class WebSocketApi:
         Handles incoming WebSocket connections and processes messages.
 
         This method accepts a new connection, listens for incoming messages,
-        and routes them to the handler orchestrator.
+        and routes them to the handler orchestrator. A frame may contain a single message
+        or a batch, i.e. a list of messages processed in order.
 
         Args:
             websocket (WebSocket): The WebSocket connection instance.
         """
         await websocket.accept()
+        recorder = self.__recorder
+        session = Session(websocket, next(self.__session_ids), self.__outbound_metrics, recorder,
+                          self.__max_backlog)
+
+        if recorder is not None:
+            recorder.record(Direction.CONNECT, session.id)
 
         try:
             while True:
                 data = await websocket.receive_text()
 
-                try:
-                    message = json.loads(data)
-                except json.JSONDecodeError:
-                    logger.error("Invalid JSON received")
-                    continue
+                if recorder is not None:
+                    recorder.record_inbound(session.id, data)
 
                 try:
-                    event, data, timestamp = self.get_message_info(message)
+                    message = self.__codec.decode(data)
                 except ValueError:
-                    logger.error("Invalid message contents, can't parse")
+                    logger.error("Invalid JSON received")
                     continue
 
-                if event == 'subscribe':
-                    self.__sender_orchestrator.subscribe(websocket, data)
-                elif event == 'unsubscribe':
-                    self.__sender_orchestrator.unsubscribe(websocket, data)
+                if isinstance(message, list):
+                    for batched_message in message:
+                        await self.process_message(session, batched_message)
                 else:
-                    await self.__handler_orchestrator.handle_message(event, data, timestamp)
+                    await self.process_message(session, message)
         except WebSocketDisconnect as _:
-            self.__sender_orchestrator.unsubscribe(websocket)
+            pass
+        finally:
+            self.__sender_orchestrator.unsubscribe(session)
+            self.__handler_orchestrator.cancel_calls(session)
+            session.close()
+
+            if recorder is not None:
+                recorder.record(Direction.DISCONNECT, session.id)
+
+    async def process_message(self, session: Session, message: Any) -> None:
+        """
+        Routes a single decoded message of a connection.
+
+        Args:
+            session (Session): The session of the connection.
+            message (Any): The decoded message.
+        """
+        if not isinstance(message, dict):
+            logger.error("Invalid message contents, can't parse")
+            return
+
+        try:
+            event, data, timestamp = self.get_message_info(message)
+        except ValueError:
+            logger.error("Invalid message contents, can't parse")
+            return
+
+        if event == 'subscribe':
+            self.__sender_orchestrator.subscribe(session, data)
+        elif event == 'unsubscribe':
+            self.__sender_orchestrator.unsubscribe(session, data)
+        elif event == RPC_EVENT:
+            self.__handler_orchestrator.handle_call(session, data)
+        elif event == RPC_CANCEL_EVENT:
+            self.__handler_orchestrator.cancel_call(session, data)
+        else:
+            await self.__handler_orchestrator.handle_message(event, data, timestamp)
 
     @staticmethod
     def get_message_info( message: dict[str, Any]) -> (str, dict[str,Any], datetime.datetime):
@@ -174,8 +291,9 @@ class WebSocketApi:
         """
         Manages the startup and shutdown phases of the FastAPI application.
 
-        During startup, it starts all senders that are instances of AbstractTimedSender.
-        During shutdown, it cancels ongoing tasks gracefully.
+        During startup, it starts all senders that are instances of AbstractTimedSender or
+        AbstractStreamingSender, the registered computation graphs and the loop lag monitor, if one is attached.
+        During shutdown, it stops the started senders and cancels ongoing tasks gracefully.
 
         Args:
             app (FastAPI): The FastAPI application instance.
@@ -184,24 +302,43 @@ class WebSocketApi:
             None
         """
         # Startup phase, executes before serving messages
-        async def safe_start(timed_sender: AbstractTimedSender):
+        async def safe_start(running_sender: Union[AbstractTimedSender, AbstractStreamingSender]):
             try:
-                await timed_sender.start()
+                await running_sender.start()
             except Exception as e:
-                logger.error(f"Error in sender {timed_sender}: {e}")
+                logger.error(f"Error in sender {running_sender}: {e}")
                 traceback.print_exc(file=sys.stdout)
 
+        running = []
         tasks = []
         for sender in self.__sender_orchestrator.senders:
-            if isinstance(sender, AbstractTimedSender):
+            if isinstance(sender, (AbstractTimedSender, AbstractStreamingSender)):
                 task = asyncio.create_task(safe_start(sender))
+                running.append(sender)
                 tasks.append(task)
 
+        for graph in self.__sender_orchestrator.graphs:
+            tasks.append(asyncio.create_task(graph.start()))
+            running.append(graph)
+
+        monitor_task = None
+        if self.__loop_lag_monitor is not None:
+            monitor_task = asyncio.create_task(self.__loop_lag_monitor.start())
+
         # Yield is for the working state of the app
         yield
         # Shutdown phase, executes when the application is shutting down
 
-        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        if monitor_task is not None:
+            self.__loop_lag_monitor.stop()
+            monitor_task.cancel()
+
+        for sender in running:
+            sender.stop()
+
+        # Streaming senders may wait for their source indefinitely, so give the senders a bounded time to finish
+        done, pending = await asyncio.wait(tasks, timeout=1, return_when=asyncio.FIRST_EXCEPTION) \
+            if tasks else (set(), set())
 
         for task in done:
             if e := task.exception():
@@ -216,3 +353,6 @@ class WebSocketApi:
             except asyncio.CancelledError:
                 pass
 
+        if self.__recorder is not None:
+            self.__recorder.close()
+
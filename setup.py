@@ -13,8 +13,12 @@ setup(
     install_requires=[
         "uvicorn[standard]",
         "fastapi",
-        "loguru"
+        "loguru",
+        "websockets>=13.0"
     ],
+    extras_require={
+        "orjson": ["orjson"]
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
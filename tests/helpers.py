@@ -0,0 +1,85 @@
+import asyncio
+import json
+from typing import Any, Optional
+
+from bounce_ws.senders import AbstractSender, AbstractTimedSender
+from bounce_ws.sessions import Priority, Session
+
+
+class RecordingWebSocket:
+    """
+    A WebSocket stand-in recording the sent messages, optionally delaying or never completing a send.
+    """
+
+    def __init__(self, stalled: bool = False, delay: float = 0):
+        self.sent: list[str] = []
+        self.close_code: Optional[int] = None
+        self._stalled = stalled
+        self._delay = delay
+
+    async def send_text(self, message: str) -> None:
+        self.sent.append(message)
+
+        if self._delay:
+            await asyncio.sleep(self._delay)
+
+        if self._stalled:
+            await asyncio.Event().wait()
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+    def messages(self) -> list[dict[str, Any]]:
+        return [json.loads(message) for message in self.sent]
+
+
+class CapturingSession(Session):
+    """
+    A session recording the queued messages and their priorities instead of sending them.
+    """
+
+    def __init__(self):
+        super().__init__(None)
+        self.received: list[str] = []
+        self.priorities: list[Priority] = []
+
+    def send(self, message: str, priority: Priority = Priority.NORMAL) -> None:
+        self.received.append(message)
+        self.priorities.append(priority)
+
+    def messages(self) -> list[dict[str, Any]]:
+        return [json.loads(message) for message in self.received]
+
+
+class StaticSender(AbstractSender):
+    def __init__(self, event_name: str, replay_buffer_size: int = 0):
+        super().__init__(replay_buffer_size)
+        self._event_name = event_name
+
+    @property
+    def event_name(self) -> str:
+        return self._event_name
+
+    def create_message_data(self):
+        return {}
+
+
+class StaticTimedSender(AbstractTimedSender):
+    def __init__(self, event_name: str, framerate: float = 10, **kwargs):
+        super().__init__(framerate, **kwargs)
+        self._event_name = event_name
+
+    @property
+    def event_name(self) -> str:
+        return self._event_name
+
+    def create_message_data(self):
+        return {}
+
+
+async def flush() -> None:
+    """
+    Lets the session writer tasks run.
+    """
+    for _ in range(5):
+        await asyncio.sleep(0)
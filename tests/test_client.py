@@ -0,0 +1,94 @@
+import asyncio
+import json
+
+import pytest
+from websockets.asyncio.server import serve
+
+from bounce_ws.client import BounceClient, RpcError
+
+
+def test_send_drops_messages_beyond_max_backlog():
+    client = BounceClient("ws://localhost:1", max_backlog=4)
+
+    for index in range(10):
+        client.send("ping", {"index": index})
+
+    assert client.backlog == 4
+    assert client.dropped == 6
+    assert [message["data"]["index"] for message in client._outbound] == [0, 1, 2, 3]
+
+
+def test_drain_waits_for_reconnect():
+    async def scenario():
+        received = []
+
+        async def handler(websocket):
+            async for frame in websocket:
+                received.append(json.loads(frame))
+
+        server = await serve(handler, "localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = BounceClient(f"ws://localhost:{port}", backoff_initial=0.05, backoff_max=0.05)
+        await client.connect()
+
+        server.close()
+        await server.wait_closed()
+        await asyncio.sleep(0.05)
+
+        client.send("ping")
+        drain = asyncio.create_task(client.drain())
+        await asyncio.sleep(0.2)
+
+        assert not client.connected
+        assert not drain.done()
+
+        server = await serve(handler, "localhost", port)
+        await asyncio.wait_for(drain, 1)
+
+        assert client.backlog == 0
+        assert [message["event"] for message in received] == ["ping"]
+
+        await client.close()
+        server.close()
+
+        with pytest.raises(ConnectionError):
+            await client.drain()
+
+    asyncio.run(scenario())
+
+
+def test_lost_calls_are_not_resent():
+    async def scenario():
+        client = BounceClient("ws://localhost:1")
+        client.send("ping")
+        call = asyncio.create_task(client.call("add", {"a": 1}))
+        await asyncio.sleep(0)
+
+        client._fail_calls("Connection lost")
+
+        with pytest.raises(RpcError, match="Connection lost"):
+            await call
+
+        assert [message["event"] for message in client._outbound] == ["ping"]
+
+    asyncio.run(scenario())
+
+
+def test_unsent_call_is_withdrawn_on_timeout():
+    async def scenario():
+        client = BounceClient("ws://localhost:1")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.call("add", timeout=0.01)
+
+        assert client.backlog == 0
+
+    asyncio.run(scenario())
+
+
+def test_wildcard_subscription_resumes_all_events():
+    client = BounceClient("ws://localhost:1")
+    client._positions = {"clock": {"epoch": "a", "seq": 3}, "ping": {"epoch": "b", "seq": 7}}
+
+    assert client._subscribe_message(["*"])["data"]["resume_from"] == client._positions
+    assert client._subscribe_message(["clock"])["data"]["resume_from"] == {"clock": {"epoch": "a", "seq": 3}}
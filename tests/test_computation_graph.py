@@ -0,0 +1,122 @@
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from bounce_ws.graph import AbstractDerivedSender, AbstractSource, ComputationGraph
+from bounce_ws.senders import SenderOrchestrator
+
+from helpers import CapturingSession
+
+
+class CountingSource(AbstractSource):
+    def __init__(self, name: str, dependencies: Optional[list[AbstractSource]] = None, fails: bool = False):
+        super().__init__(dependencies)
+        self._name = name
+        self.fails = fails
+        self.computed = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def compute(self, inputs: dict[str, Any]) -> Any:
+        self.computed += 1
+
+        if self.fails:
+            raise RuntimeError(f"{self._name} failed")
+
+        return sum(inputs.values()) + 1
+
+
+class SumSender(AbstractDerivedSender):
+    def __init__(self, event_name: str, dependencies: list[AbstractSource]):
+        super().__init__(dependencies)
+        self._event_name = event_name
+
+    @property
+    def event_name(self) -> str:
+        return self._event_name
+
+    def derive_message_data(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {"sum": sum(inputs.values())}
+
+
+def make_graph(*senders: SumSender) -> tuple[SenderOrchestrator, ComputationGraph]:
+    orchestrator = SenderOrchestrator()
+    graph = ComputationGraph(framerate=10)
+
+    for sender in senders:
+        graph.add_sender(sender)
+
+    orchestrator.register_graph(graph)
+    return orchestrator, graph
+
+
+def subscribe(orchestrator: SenderOrchestrator, *events: str) -> CapturingSession:
+    session = CapturingSession()
+    orchestrator.subscribe(session, {"events": list(events)})
+    return session
+
+
+def test_shared_source_is_computed_once_per_tick():
+    base = CountingSource("test_graph_memo_base")
+    first = SumSender("test_graph_memo_first", [base])
+    second = SumSender("test_graph_memo_second", [base, CountingSource("test_graph_memo_derived", [base])])
+    orchestrator, graph = make_graph(first, second)
+    session = subscribe(orchestrator, "test_graph_memo_first", "test_graph_memo_second")
+
+    asyncio.run(graph.evaluate())
+    asyncio.run(graph.evaluate())
+
+    assert base.computed == 2
+    assert [message["data"]["sum"] for message in session.messages()] == [1, 3, 1, 3]
+
+
+def test_sources_without_subscribers_are_skipped():
+    watched = CountingSource("test_graph_skip_watched")
+    idle = CountingSource("test_graph_skip_idle")
+    orchestrator, graph = make_graph(SumSender("test_graph_skip_first", [watched]),
+                                     SumSender("test_graph_skip_second", [idle]))
+
+    asyncio.run(graph.evaluate())
+    assert watched.computed == idle.computed == 0
+
+    subscribe(orchestrator, "test_graph_skip_first")
+    asyncio.run(graph.evaluate())
+
+    assert watched.computed == 1
+    assert idle.computed == 0
+    assert graph.tick == 2
+
+
+def test_failing_source_only_skips_its_dependents():
+    failing = CountingSource("test_graph_fail_failing", fails=True)
+    dependent = CountingSource("test_graph_fail_dependent", [failing])
+    healthy = CountingSource("test_graph_fail_healthy")
+    orchestrator, graph = make_graph(SumSender("test_graph_fail_broken", [dependent]),
+                                     SumSender("test_graph_fail_working", [healthy]))
+    session = subscribe(orchestrator, "test_graph_fail_broken", "test_graph_fail_working")
+
+    asyncio.run(graph.evaluate())
+
+    assert failing.computed == 1
+    assert dependent.computed == 0
+    assert [message["event"] for message in session.messages()] == ["test_graph_fail_working"]
+
+
+def test_cycle_is_rejected():
+    first = CountingSource("test_graph_cycle_first")
+    second = CountingSource("test_graph_cycle_second", [first])
+    first.dependencies.append(second)
+
+    with pytest.raises(ValueError, match="depends on itself"):
+        ComputationGraph(framerate=10).add_sender(SumSender("test_graph_cycle", [second]))
+
+
+def test_shared_name_is_rejected():
+    graph = ComputationGraph(framerate=10)
+    graph.add_sender(SumSender("test_graph_name_first", [CountingSource("test_graph_name_source")]))
+
+    with pytest.raises(ValueError, match="share the name"):
+        graph.add_sender(SumSender("test_graph_name_second", [CountingSource("test_graph_name_source")]))
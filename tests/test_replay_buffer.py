@@ -0,0 +1,101 @@
+import asyncio
+
+from bounce_ws.senders import ReplayBuffer, SenderOrchestrator
+from bounce_ws.sessions import Session
+
+from helpers import RecordingWebSocket, StaticSender, flush
+
+
+def make_buffer(size: int, count: int) -> ReplayBuffer:
+    buffer = ReplayBuffer(size)
+
+    for _ in range(count):
+        sequence = buffer.allocate()
+        buffer.append(sequence, f"message {sequence}")
+
+    return buffer
+
+
+def test_since_returns_messages_after_buffered_gap():
+    buffer = make_buffer(4, 6)
+
+    assert buffer.since(buffer.epoch, 3) == ["message 4", "message 5", "message 6"]
+    assert buffer.since(buffer.epoch, 2) == ["message 3", "message 4", "message 5", "message 6"]
+
+
+def test_since_without_gap_returns_nothing():
+    buffer = make_buffer(4, 6)
+
+    assert buffer.since(buffer.epoch, 6) == []
+
+
+def test_since_evicted_gap_requires_resync():
+    buffer = make_buffer(4, 6)
+
+    assert buffer.since(buffer.epoch, 1) is None
+
+
+def test_since_wrong_epoch_requires_resync():
+    buffer = make_buffer(4, 6)
+
+    assert buffer.since("0" * 16, 5) is None
+    assert buffer.since(ReplayBuffer(4).epoch, 5) is None
+
+
+def test_since_future_or_negative_sequence_requires_resync():
+    buffer = make_buffer(4, 6)
+
+    assert buffer.since(buffer.epoch, 7) is None
+    assert buffer.since(buffer.epoch, -1) is None
+
+
+def resume(event_name: str, resume_from) -> list[dict]:
+    async def run() -> list[dict]:
+        orchestrator = SenderOrchestrator()
+        sender = StaticSender(event_name, replay_buffer_size=8)
+        orchestrator.register_sender(sender)
+
+        for _ in range(3):
+            await sender.send()
+
+        if callable(resume_from):
+            data = resume_from(sender)
+        else:
+            data = resume_from
+
+        websocket = RecordingWebSocket()
+        session = Session(websocket)
+        orchestrator.subscribe(session, {"events": [event_name], "resume_from": data})
+        await flush()
+
+        return websocket.messages()
+
+    return asyncio.run(run())
+
+
+def test_resume_replays_missed_messages():
+    messages = resume("test_resume_valid",
+                      lambda sender: {"test_resume_valid": {"epoch": sender._replay_buffer.epoch, "seq": 1}})
+
+    assert [message["seq"] for message in messages] == [2, 3]
+
+
+def test_resume_with_wrong_epoch_requires_resync():
+    messages = resume("test_resume_epoch", {"test_resume_epoch": {"epoch": "0" * 16, "seq": 1}})
+
+    assert [message["event"] for message in messages] == ["resync_required"]
+    assert messages[0]["data"]["seq"] == 3
+
+
+def test_non_dict_resume_from_requires_resync():
+    messages = resume("test_resume_list", ["test_resume_list"])
+
+    assert [message["event"] for message in messages] == ["resync_required"]
+    assert messages[0]["data"]["event"] == "test_resume_list"
+
+
+def test_bool_sequence_requires_resync():
+    messages = resume("test_resume_bool",
+                      lambda sender: {"test_resume_bool": {"epoch": sender._replay_buffer.epoch, "seq": True}})
+
+    assert [message["event"] for message in messages] == ["resync_required"]
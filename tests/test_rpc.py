@@ -0,0 +1,176 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+import pytest
+
+from bounce_ws.handlers import AbstractRpcHandler, HandlerOrchestrator
+from bounce_ws.sessions import Priority
+
+from helpers import CapturingSession
+
+
+class SleepHandler(AbstractRpcHandler):
+    def __init__(self, timeout: Optional[float] = None):
+        super().__init__(timeout)
+
+    @property
+    def method_name(self) -> str:
+        return "sleep"
+
+    async def process_call(self, params: dict[str, Any]) -> Any:
+        await asyncio.sleep(params.get("delay", 0))
+        return params.get("value")
+
+
+class SetHandler(AbstractRpcHandler):
+    @property
+    def method_name(self) -> str:
+        return "set"
+
+    def process_call(self, params: dict[str, Any]) -> Any:
+        return {1, 2}
+
+
+def make_orchestrator(**kwargs) -> HandlerOrchestrator:
+    orchestrator = HandlerOrchestrator(**kwargs)
+    orchestrator.register_rpc_handler(SleepHandler())
+    orchestrator.register_rpc_handler(SetHandler())
+    return orchestrator
+
+
+def outcomes(session: CapturingSession) -> dict[Any, Any]:
+    return {message["data"]["id"]: message["data"].get("result", message["data"].get("error"))
+            for message in session.messages()}
+
+
+def test_concurrent_calls():
+    async def scenario():
+        orchestrator = make_orchestrator()
+        session = CapturingSession()
+        started = time.perf_counter()
+
+        orchestrator.handle_call(session, {"id": 1, "method": "sleep", "params": {"delay": 0.05, "value": "a"}})
+        orchestrator.handle_call(session, {"id": "b", "method": "sleep", "params": {"delay": 0.05, "value": "b"}})
+        await asyncio.sleep(0.08)
+
+        assert time.perf_counter() - started < 0.1
+        assert outcomes(session) == {1: "a", "b": "b"}
+        assert [message["event"] for message in session.messages()] == ["rpc_result", "rpc_result"]
+        assert session.priorities == [Priority.HIGH, Priority.HIGH]
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("data, error", [
+    ({"id": True, "method": "sleep"}, "Invalid call id, must be a string or an integer"),
+    ({"id": 1.5, "method": "sleep"}, "Invalid call id, must be a string or an integer"),
+    ({"id": 1, "method": ["sleep"]}, "Invalid method, must be a string"),
+    ({"id": 1, "method": "missing"}, "Unknown method: missing"),
+])
+def test_invalid_calls_are_rejected(data, error):
+    async def scenario():
+        session = CapturingSession()
+        make_orchestrator().handle_call(session, data)
+
+        assert [message["data"]["error"] for message in session.messages()] == [error]
+
+    asyncio.run(scenario())
+
+
+def test_duplicate_id_is_rejected():
+    async def scenario():
+        orchestrator = make_orchestrator()
+        session = CapturingSession()
+
+        orchestrator.handle_call(session, {"id": 1, "method": "sleep", "params": {"delay": 0.01, "value": "first"}})
+        orchestrator.handle_call(session, {"id": 1, "method": "sleep", "params": {"value": "second"}})
+
+        assert outcomes(session) == {1: "Call with the same id is already in flight"}
+
+        await asyncio.sleep(0.03)
+
+        assert outcomes(session) == {1: "first"}
+
+    asyncio.run(scenario())
+
+
+def test_calls_in_flight_are_limited():
+    async def scenario():
+        orchestrator = make_orchestrator(max_calls_per_connection=2)
+        session = CapturingSession()
+
+        for call_id in range(3):
+            orchestrator.handle_call(session, {"id": call_id, "method": "sleep", "params": {"delay": 0.01}})
+
+        assert outcomes(session) == {2: "Too many calls in flight"}
+
+        await asyncio.sleep(0.03)
+        orchestrator.handle_call(session, {"id": 3, "method": "sleep", "params": {"value": "accepted"}})
+        await asyncio.sleep(0.01)
+
+        assert outcomes(session)[3] == "accepted"
+
+    asyncio.run(scenario())
+
+
+def test_timeout():
+    async def scenario():
+        orchestrator = HandlerOrchestrator()
+        orchestrator.register_rpc_handler(SleepHandler(timeout=0.01))
+        session = CapturingSession()
+
+        orchestrator.handle_call(session, {"id": 1, "method": "sleep", "params": {"delay": 1}})
+        await asyncio.sleep(0.05)
+
+        assert outcomes(session) == {1: "Timeout"}
+
+    asyncio.run(scenario())
+
+
+def test_rpc_cancel():
+    async def scenario():
+        orchestrator = make_orchestrator()
+        session = CapturingSession()
+
+        orchestrator.handle_call(session, {"id": 1, "method": "sleep", "params": {"delay": 1}})
+        orchestrator.handle_call(session, {"id": 2, "method": "sleep", "params": {"delay": 0.01, "value": "done"}})
+        await asyncio.sleep(0)
+        orchestrator.cancel_call(session, {"id": 1})
+        await asyncio.sleep(0.03)
+
+        assert outcomes(session) == {1: "Cancelled", 2: "done"}
+
+    asyncio.run(scenario())
+
+
+def test_unencodable_result_is_reported():
+    async def scenario():
+        session = CapturingSession()
+        make_orchestrator().handle_call(session, {"id": 1, "method": "set"})
+        await asyncio.sleep(0)
+
+        messages = session.messages()
+
+        assert [message["event"] for message in messages] == ["rpc_error"]
+        assert messages[0]["data"]["id"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_disconnect_cancels_calls():
+    async def scenario():
+        orchestrator = make_orchestrator()
+        session = CapturingSession()
+
+        for call_id in range(3):
+            orchestrator.handle_call(session, {"id": call_id, "method": "sleep", "params": {"delay": 1}})
+
+        await asyncio.sleep(0)
+        orchestrator.cancel_calls(session)
+        await asyncio.sleep(0.01)
+
+        assert outcomes(session) == {0: "Cancelled", 1: "Cancelled", 2: "Cancelled"}
+        assert session not in orchestrator._calls
+
+    asyncio.run(scenario())
@@ -0,0 +1,136 @@
+import asyncio
+import platform
+import sys
+
+import pytest
+
+from bounce_ws.senders import SenderOrchestrator
+from bounce_ws.sessions import OutboundMetrics, Priority, Session
+
+from helpers import RecordingWebSocket, StaticSender
+
+
+def make_orchestrator(count: int) -> tuple[SenderOrchestrator, list[StaticSender]]:
+    orchestrator = SenderOrchestrator()
+    senders = [StaticSender(f"test_session_{index}") for index in range(count)]
+
+    for sender in senders:
+        orchestrator.register_sender(sender)
+
+    return orchestrator, senders
+
+
+@pytest.mark.skipif(platform.python_implementation() != "CPython" or sys.maxsize < 2 ** 32,
+                    reason="documented size applies to 64-bit CPython")
+def test_idle_session_size():
+    assert sys.getsizeof(Session(None)) == 128
+
+
+def test_session_has_no_instance_dict():
+    assert not hasattr(Session(None), "__dict__")
+
+
+def test_subscriptions_add_only_bits_and_array_entries():
+    orchestrator, senders = make_orchestrator(16)
+    session = Session(None)
+    idle_size = sys.getsizeof(session)
+
+    orchestrator.subscribe(session, {"events": [sender.event_name for sender in senders]})
+
+    assert sys.getsizeof(session) == idle_size
+    assert bin(session.subscriptions).count("1") == len(senders)
+
+    for sender in senders:
+        assert sender.has_connection(session)
+        assert sender._connections == [session]
+
+
+def test_unsubscribe_compacts_session_arrays():
+    orchestrator, senders = make_orchestrator(1)
+    sender = senders[0]
+    sessions = [Session(None, session_id) for session_id in range(4)]
+
+    for session in sessions:
+        orchestrator.subscribe(session, {"events": [sender.event_name]})
+
+    for session in sessions[:3]:
+        orchestrator.unsubscribe(session)
+
+    assert sender.connection_count == 1
+    assert sender._connections == [sessions[3]]
+    assert all(session.subscriptions == 0 and session.listed == 0 for session in sessions[:3])
+
+
+def test_full_backlog_drops_lower_priority_messages():
+    async def scenario():
+        session = Session(RecordingWebSocket(stalled=True), max_backlog=3)
+
+        session.send("first", Priority.BULK)
+        await asyncio.sleep(0)
+
+        for message in ("bulk", "normal", "high"):
+            session.send(message, Priority.BULK if message == "bulk" else
+                         Priority.NORMAL if message == "normal" else Priority.HIGH)
+
+        assert session.backlog == 3
+
+        session.send("critical", Priority.CRITICAL)
+        session.send("late bulk", Priority.BULK)
+
+        assert session.backlog == 3
+        assert session.dropped == 2
+        assert [message for lane in session._lanes for message, _ in lane] == ["critical", "high", "normal"]
+
+        session.close()
+
+    asyncio.run(scenario())
+
+
+def test_backlog_full_of_high_priority_messages_closes_connection():
+    async def scenario():
+        websocket = RecordingWebSocket(stalled=True)
+        session = Session(websocket, max_backlog=2)
+
+        session.send("first", Priority.HIGH)
+        await asyncio.sleep(0)
+
+        for _ in range(3):
+            session.send("high", Priority.HIGH)
+
+        assert session._writer is not None
+
+        await asyncio.sleep(0)
+
+        assert session.backlog == 0
+        assert websocket.close_code == 1013
+        assert session._writer is None
+
+    asyncio.run(scenario())
+
+
+def test_high_priority_latency_stays_low_under_bulk_flood():
+    async def scenario():
+        metrics = OutboundMetrics()
+        websocket = RecordingWebSocket(delay=0.001)
+        session = Session(websocket, metrics=metrics)
+
+        for index in range(200):
+            session.send(f"bulk {index}", Priority.BULK)
+
+        await asyncio.sleep(0.01)
+
+        for index in range(10):
+            session.send(f"critical {index}", Priority.CRITICAL)
+            session.send(f"high {index}", Priority.HIGH)
+
+        while session.backlog:
+            await asyncio.sleep(0.01)
+
+        await asyncio.sleep(0.01)
+
+        assert websocket.sent.index("high 9") < websocket.sent.index("bulk 50")
+        assert metrics.percentile(Priority.CRITICAL, 99) * 10 < metrics.percentile(Priority.BULK, 50)
+        # High priority messages only wait for the critical ones, never for the bulk flood
+        assert metrics.percentile(Priority.HIGH, 99) * 4 < metrics.percentile(Priority.BULK, 50)
+
+    asyncio.run(scenario())
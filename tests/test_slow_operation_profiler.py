@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+import pytest
+
+from bounce_ws.monitoring import SlowOperationProfiler
+
+
+def stats_of(profiler: SlowOperationProfiler, event_name: str):
+    return next(stats for stats in profiler.top_operations() if stats.event_name == event_name)
+
+
+def test_awaited_io_is_not_counted():
+    profiler = SlowOperationProfiler(threshold=0.05)
+
+    async def waiting():
+        await asyncio.sleep(0.2)
+        return "done"
+
+    assert asyncio.run(profiler.measure("handler", "waiting", waiting)) == "done"
+
+    stats = stats_of(profiler, "waiting")
+    assert stats.calls == 1
+    assert stats.slow_calls == 0
+    assert stats.max_time < 0.05
+
+
+def test_blocking_steps_are_summed():
+    profiler = SlowOperationProfiler(threshold=0.05)
+
+    async def blocking():
+        time.sleep(0.04)
+        await asyncio.sleep(0.1)
+        time.sleep(0.04)
+        return 1
+
+    asyncio.run(profiler.measure("handler", "blocking", blocking))
+
+    stats = stats_of(profiler, "blocking")
+    assert stats.slow_calls == 1
+    assert 0.08 <= stats.max_time < 0.15
+
+
+def test_synchronous_operation_with_arguments():
+    profiler = SlowOperationProfiler(threshold=0.01)
+
+    def blocking(value):
+        time.sleep(0.02)
+        return value * 2
+
+    assert asyncio.run(profiler.measure("sender", "sync", blocking, 21)) == 42
+    assert stats_of(profiler, "sync").slow_calls == 1
+
+
+def test_exceptions_are_recorded_and_propagated():
+    profiler = SlowOperationProfiler(threshold=0.01)
+
+    async def failing():
+        await asyncio.sleep(0)
+        time.sleep(0.02)
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        asyncio.run(profiler.measure("handler", "failing", failing))
+
+    stats = stats_of(profiler, "failing")
+    assert stats.calls == 1
+    assert stats.slow_calls == 1
+
+
+def test_exceptions_of_awaited_futures_reach_the_operation():
+    profiler = SlowOperationProfiler()
+
+    async def catching():
+        future = asyncio.get_running_loop().create_future()
+        asyncio.get_running_loop().call_later(0.01, future.set_exception, ValueError("failed"))
+
+        try:
+            await future
+        except ValueError as e:
+            return str(e)
+
+    assert asyncio.run(profiler.measure("handler", "catching", catching)) == "failed"
+
+
+def test_outer_cancellation_reaches_the_operation():
+    profiler = SlowOperationProfiler()
+    cleaned_up = []
+
+    async def waiting():
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cleaned_up.append(True)
+
+    async def scenario():
+        task = asyncio.create_task(profiler.measure("handler", "cancelled", waiting))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+    assert cleaned_up == [True]
+    assert stats_of(profiler, "cancelled").calls == 1
+
+
+@pytest.mark.skipif(not hasattr(asyncio, "timeout"), reason="asyncio.timeout requires Python 3.11")
+def test_timeout_inside_operation():
+    profiler = SlowOperationProfiler()
+
+    async def timing_out():
+        try:
+            async with asyncio.timeout(0.01):
+                await asyncio.sleep(10)
+        except TimeoutError:
+            return "timed out"
+
+    assert asyncio.run(profiler.measure("handler", "timeout", timing_out)) == "timed out"
+
+
+def test_wait_for_and_gather_inside_operation():
+    profiler = SlowOperationProfiler()
+
+    async def combined():
+        results = await asyncio.gather(asyncio.sleep(0.01, "a"), asyncio.sleep(0.02, "b"))
+
+        try:
+            await asyncio.wait_for(asyncio.sleep(10), 0.01)
+        except asyncio.TimeoutError:
+            results.append("timeout")
+
+        return results
+
+    assert asyncio.run(profiler.measure("handler", "combined", combined)) == ["a", "b", "timeout"]
+
+
+def test_disabled_profiler_passes_through():
+    profiler = SlowOperationProfiler(threshold=0.0, enabled=False)
+
+    async def operation(value):
+        await asyncio.sleep(0)
+        return value
+
+    assert asyncio.run(profiler.measure("handler", "disabled", operation, 7)) == 7
+    assert asyncio.run(profiler.measure("handler", "disabled", lambda: 8)) == 8
+    assert profiler.top_operations() == []
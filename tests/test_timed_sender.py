@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from bounce_ws.senders import SenderOrchestrator
+
+from helpers import CapturingSession, StaticTimedSender
+
+
+class BacklogSession(CapturingSession):
+    """
+    A capturing session with a backlog set by the test.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.pending: int = 0
+
+    @property
+    def backlog(self) -> int:
+        return self.pending
+
+
+def make_sender(event_name: str, **kwargs) -> tuple[SenderOrchestrator, StaticTimedSender]:
+    orchestrator = SenderOrchestrator()
+    sender = StaticTimedSender(event_name, framerate=10, **kwargs)
+    orchestrator.register_sender(sender)
+    return orchestrator, sender
+
+
+def tick(sender: StaticTimedSender, count: int) -> None:
+    async def run():
+        for _ in range(count):
+            await sender.send()
+
+    asyncio.run(run())
+
+
+def test_divisor_delivers_every_nth_tick():
+    orchestrator, sender = make_sender("test_timed_divisor")
+    slow, full = BacklogSession(), BacklogSession()
+
+    orchestrator.subscribe(slow, {"events": ["test_timed_divisor"], "rates": {"test_timed_divisor": 2.5}})
+    orchestrator.subscribe(full, {"events": ["test_timed_divisor"]})
+    tick(sender, 12)
+
+    assert sender.get_rate(slow) == 2.5
+    assert len(slow.received) == 3
+    assert len(full.received) == 12
+
+
+def test_adaptive_rate_follows_backlog():
+    orchestrator, sender = make_sender("test_timed_adaptive", adaptive=True,
+                                       backlog_high=4, backlog_low=1, max_divisor=8)
+    session = BacklogSession()
+    orchestrator.subscribe(session, {"events": ["test_timed_adaptive"], "rates": {"test_timed_adaptive": 5}})
+
+    tick(sender, 4)
+    assert len(session.received) == 2
+    assert sender.get_rate(session) == 5
+
+    session.pending = 10
+    tick(sender, 20)
+    assert sender.get_rate(session) == 10 / 8
+
+    session.pending = 0
+    tick(sender, 16)
+    # Halved back to the requested rate, never above it
+    assert sender.get_rate(session) == 5
+
+
+def test_adaptive_rate_restores_full_rate():
+    orchestrator, sender = make_sender("test_timed_adaptive_full", adaptive=True,
+                                       backlog_high=4, backlog_low=1, max_divisor=8)
+    session = BacklogSession()
+    orchestrator.subscribe(session, {"events": ["test_timed_adaptive_full"]})
+
+    session.pending = 10
+    tick(sender, 4)
+    assert sender.get_rate(session) == 10 / 4
+
+    session.pending = 0
+    tick(sender, 8)
+    assert sender.get_rate(session) == 10
+    assert session not in sender._divisors
+
+
+@pytest.mark.parametrize("rates", [
+    {"test_timed_invalid": 0},
+    {"test_timed_invalid": -1},
+    {"test_timed_invalid": float("nan")},
+    {"test_timed_invalid": True},
+    {"test_timed_invalid": "x"},
+    ["test_timed_invalid"],
+])
+def test_invalid_rates_are_ignored(rates):
+    orchestrator, sender = make_sender("test_timed_invalid")
+    session = BacklogSession()
+    orchestrator.subscribe(session, {"events": ["test_timed_invalid"], "rates": {"test_timed_invalid": 5}})
+
+    orchestrator.subscribe(session, {"events": ["test_timed_invalid"], "rates": rates})
+
+    assert sender._divisors == {session: [2, 2]}
+    assert sender.has_connection(session)
+    assert not session._closed
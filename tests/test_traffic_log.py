@@ -0,0 +1,32 @@
+import os
+import time
+
+from bounce_ws.capture import Direction, TrafficLogReader, TrafficRecorder
+from bounce_ws.capture.traffic_log import LOG_MAGIC
+
+
+def test_records_are_flushed_periodically(tmp_path):
+    path = str(tmp_path / "traffic.log")
+    recorder = TrafficRecorder(path, flush_interval=0.01)
+
+    recorder.record(Direction.CONNECT, 1)
+    assert os.path.getsize(path) == 0
+
+    time.sleep(0.02)
+    recorder.record_inbound(1, "message")
+    assert os.path.getsize(path) > len(LOG_MAGIC)
+
+    recorder.close()
+
+
+def test_records_stay_buffered_without_flush_interval(tmp_path):
+    path = str(tmp_path / "traffic.log")
+    recorder = TrafficRecorder(path, flush_interval=None)
+
+    recorder.record_outbound(1, "message")
+    assert os.path.getsize(path) == 0
+
+    recorder.close()
+
+    with TrafficLogReader(path) as reader:
+        assert [(record.direction, record.payload) for record in reader] == [(Direction.OUTBOUND, "message")]